@@ -4,13 +4,13 @@ from .config.config import DevelopmentConfig, ProductionConfig
 from .db import create_table
 from .logging import setup_logging
 from .routes import init_routes
-from .scheduler import start_scheduler, stop_scheduler, is_scheduler_running
 import os
 from .config.config import Config
 
 def create_app():
     """
     Flask 애플리케이션을 생성하고 초기화하는 함수.
+    라우트 등록은 실패하면 예외를 그대로 발생시키고, 데이터베이스와 스케줄러 초기화 실패는 기록만 합니다.
     """
     app = Flask(__name__)
 
@@ -22,30 +22,32 @@ def create_app():
         app.config.from_object(DevelopmentConfig)
 
     # 로그 설정
-    logger = setup_logging()
+    logger = setup_logging(__name__)
 
     # CORS 설정: 환경에 따라 허용할 도메인만 허용
     CORS(app, resources={r"/api/*": {"origins": app.config['CORS_ALLOWED_ORIGINS']}})
 
     logger.info('Initializing Flask application...')
 
+    # 라우트 초기화 (실패하면 라우트 없는 앱이 뜨지 않도록 예외를 그대로 전달)
+    logger.info('Initializing routes...')
+    init_routes(app)
+    logger.info('Routes initialized successfully.')
+
     try:
         # 데이터베이스 테이블 생성
         logger.info('Creating database table...')
         create_table()
-        logger.info('Database table created successfully.')
+    except Exception as e:
+        logger.error(f'An error occurred while creating database table: {e}')
 
-        if Config.JOB_RUN:
+    if Config.JOB_RUN and Config.COLLECTOR_MODE != 'external':
+        try:
+            # 스케줄러는 필요할 때만 불러옴 (external 모드의 웹 워커에는 로드되지 않음)
+            from .scheduler import start_scheduler
             logger.info('Starting scheduler...')
             start_scheduler()
-            logger.info('Scheduler started.')
-
-        # 라우트 초기화
-        logger.info('Initializing routes...')
-        init_routes(app)
-        logger.info('Routes initialized successfully.')
-
-    except Exception as e:
-        logger.error(f'An error occurred during application initialization: {e}')
+        except Exception as e:
+            logger.error(f'An error occurred while starting scheduler: {e}')
 
     return app
@@ -5,6 +5,9 @@ from dotenv import load_dotenv
 # .env 파일 로드
 load_dotenv()
 
+# 프로젝트 루트 경로
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', secrets.token_hex(32))
 
@@ -25,6 +28,29 @@ class Config:
     DB_PASSWORD = os.getenv('DB_PASSWORD', 'root')
     DB_NAME = os.getenv('DB_NAME', 'gayou')
 
+    # places 스냅샷 설정 (데이터셋 버전을 확인하여 바뀌었으면 백그라운드에서 다시 불러오는 주기, 0이면 비활성화)
+    PLACES_REFRESH_SECONDS = int(os.getenv('PLACES_REFRESH_SECONDS', 60))
+    # 변경분만 반영한 스냅샷을 전체 재구성(IDF 재계산)하는 조건: 마지막 전체 구성 후 경과 시간(초), 삭제/교체된 행의 비율
+    PLACES_COMPACT_SECONDS = int(os.getenv('PLACES_COMPACT_SECONDS', 3600))
+    PLACES_COMPACT_RATIO = float(os.getenv('PLACES_COMPACT_RATIO', 0.2))
+
+    # 지표 설정 (여러 워커 프로세스의 지표를 합산할 디렉터리와 각 프로세스가 값을 기록하는 주기, 디렉터리가 없으면 프로세스별 값)
+    METRICS_DIR = os.getenv('METRICS_DIR')
+    METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', 5))
+
+    # HTTP 캐시/압축 설정
+    PLACES_CACHE_MAX_AGE = int(os.getenv('PLACES_CACHE_MAX_AGE', 60))        # 브라우저 캐시 시간(초)
+    PLACES_CACHE_S_MAXAGE = int(os.getenv('PLACES_CACHE_S_MAXAGE', 300))     # CDN(공유 캐시) 캐시 시간(초)
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))            # 이 크기(byte) 이상의 JSON 응답만 gzip 압축
+    COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', 5))                     # gzip 압축 수준 (1~9)
+
+    # 로그 설정
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG').upper()                # 기본 로거 레벨
+    LOG_LEVELS = os.getenv('LOG_LEVELS', 'urllib3=INFO')               # 로거별 레벨 (예: app.db=INFO,urllib3=WARNING)
+    LOG_ASYNC = os.getenv('LOG_ASYNC', 'True').lower() in ['true', '1', 'yes']  # 큐 기반 비동기 로깅 사용 여부
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))            # 비동기 로그 큐 최대 크기 (가득 차면 버림)
+    LOG_DEBUG_SAMPLE_EVERY = int(os.getenv('LOG_DEBUG_SAMPLE_EVERY', 1))  # 같은 위치의 DEBUG 로그를 N건 중 1건만 기록
+
     # Flask 설정
     WERKZEUG_RUN_MAIN = os.getenv('WERKZEUG_RUN_MAIN', 'true')
 
@@ -40,6 +66,29 @@ class Config:
     ]
     SCHEDULER_API_ENABLED = True
 
+    # 수집 작업 실행 방식 (inline | process | external)
+    COLLECTOR_MODE = os.getenv('COLLECTOR_MODE', 'process').lower()
+    # 수집 작업 잠금 방식 (mysql: 여러 호스트 간 잠금 | file: 같은 호스트 내 잠금)
+    COLLECTOR_LOCK = os.getenv('COLLECTOR_LOCK', 'mysql').lower()
+    COLLECTOR_LOCK_NAME = os.getenv('COLLECTOR_LOCK_NAME', 'gayou.collect_data')
+    COLLECTOR_LOCK_PATH = os.getenv('COLLECTOR_LOCK_PATH', os.path.join(BASE_DIR, '.collector.lock'))
+    # mysql 잠금 연결이 수집 중 유휴 상태로 끊기지 않도록 주기적으로 ping하는 간격(초)과 세션 wait_timeout(초)
+    COLLECTOR_LOCK_KEEPALIVE_SECONDS = int(os.getenv('COLLECTOR_LOCK_KEEPALIVE_SECONDS', 60))
+    COLLECTOR_LOCK_WAIT_TIMEOUT = int(os.getenv('COLLECTOR_LOCK_WAIT_TIMEOUT', 86400))
+    COLLECTOR_STATUS_PATH = os.getenv('COLLECTOR_STATUS_PATH', os.path.join(BASE_DIR, '.collector_status.json'))
+
+    # 데이터 수집 파이프라인 설정
+    # contentid 묶음(청크) 단위로 상세조회 → 전처리 → 저장이 동시에 흘러가도록 구성
+    COLLECT_CHUNK_SIZE = int(os.getenv('COLLECT_CHUNK_SIZE', 300))   # 청크당 contentid 수
+    COLLECT_WORKERS = int(os.getenv('COLLECT_WORKERS', 2))           # 상세조회/전처리 작업 스레드 수
+    COLLECT_QUEUE_SIZE = int(os.getenv('COLLECT_QUEUE_SIZE', 2))     # 단계 사이 큐에 대기할 수 있는 최대 청크 수
+
+    # 서비스 분류코드 파일 설정 (엑셀은 최초 한 번만 파싱하고 이후에는 캐시 파일을 사용)
+    CLASSIFICATION_XLSX_PATH = os.getenv(
+        'CLASSIFICATION_XLSX_PATH', os.path.join(BASE_DIR, '한국관광공사_국문_서비스분류코드_v4.2.xlsx'))
+    CLASSIFICATION_CACHE_PATH = os.getenv(
+        'CLASSIFICATION_CACHE_PATH', os.path.join(BASE_DIR, '.classification_cache.pkl'))
+
 class DevelopmentConfig(Config):
     """개발 환경 설정"""
     DEBUG = True
@@ -2,9 +2,10 @@ import mysql.connector
 from .queries import CREATE_TABLE_PLACES, SELECT_ALL_PLACES, INSERT_OR_UPDATE_PLACE, DELETE_PLACE
 from ..config.config import Config
 from ..logging import setup_logging
+from ..metrics import DB_CONNECTIONS_TOTAL
 
 # 로그 설정
-logger = setup_logging()
+logger = setup_logging(__name__)
 
 def get_db_connection():
     """데이터베이스 연결을 생성하는 함수."""
@@ -15,8 +16,10 @@ def get_db_connection():
             password=Config.DB_PASSWORD,
             database=Config.DB_NAME
         )
+        DB_CONNECTIONS_TOTAL.inc(outcome='ok')
         return conn
     except mysql.connector.Error as err:
+        DB_CONNECTIONS_TOTAL.inc(outcome='error')
         logger.error(f"Error connecting to the database: {err}")
         return None
 
@@ -34,10 +37,18 @@ def create_table():
         logger.error("Failed to create database table due to connection error.")
 
 def save_to_db(df):
-    """데이터프레임을 데이터베이스에 저장하는 함수."""
+    """
+    데이터프레임을 데이터베이스에 저장하는 함수.
+
+    Returns:
+        bool: 저장(커밋) 성공 여부.
+    """
     conn = get_db_connection()
-    if conn:
-        cursor = conn.cursor()
+    if not conn:
+        logger.error("Failed to save data to the database due to connection error.")
+        return False
+    cursor = conn.cursor()
+    try:
         for index, row in df.iterrows():
             cursor.execute(INSERT_OR_UPDATE_PLACE, (
                 row['contentid'],
@@ -62,11 +73,15 @@ def save_to_db(df):
                 row.get('combined_text', None)       # 전처리된 텍스트 추가
             ))
         conn.commit()
+        logger.info("Data successfully saved to the database.")
+        return True
+    except mysql.connector.Error as err:
+        logger.error(f"Error saving data to the database: {err}")
+        conn.rollback()
+        return False
+    finally:
         cursor.close()
         conn.close()
-        logger.info("Data successfully saved to the database.")
-    else:
-        logger.error("Failed to save data to the database due to connection error.")
 
 def execute_query(query, params=None):
     """SQL 쿼리를 실행하는 함수."""
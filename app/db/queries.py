@@ -76,6 +76,71 @@ FROM places
 WHERE 1=1
 """
 
+# 서빙 스냅샷용 조회 (긴 텍스트 컬럼 overview, overview_summary는 제외하고 필요한 행만 따로 조회)
+SELECT_PLACES_INDEX = """
+SELECT 
+    contentid,
+    addr1,
+    addr2,
+    cat1,
+    cat2,
+    cat3,
+    contenttypeid,
+    sigungucode,
+    title,
+    firstimage,
+    firstimage2,
+    mapx,
+    mapy,
+    zipcode,
+    combined_text,
+    last_updated
+FROM places
+WHERE 1=1
+"""
+
+# 마지막으로 반영한 갱신 시각 이후에 추가/수정된 행 조회 (같은 초에 갱신된 행을 놓치지 않도록 >= 사용)
+SELECT_PLACES_CHANGED = SELECT_PLACES_INDEX + """AND last_updated >= %s
+"""
+
+# 변경분 조회에서 빠진 행을 contentid로 조회 ({placeholders}는 %s 목록으로 채움)
+SELECT_PLACES_BY_IDS = SELECT_PLACES_INDEX + """AND contentid IN ({placeholders})
+"""
+
+# 삭제된 행을 찾기 위한 전체 contentid 조회
+SELECT_PLACE_IDS = """
+SELECT contentid
+FROM places
+"""
+
+# contentid 목록의 긴 텍스트 컬럼 조회 ({columns}, {placeholders}는 허용된 컬럼과 %s 목록으로 채움)
+SELECT_PLACE_DETAILS = """
+SELECT contentid, {columns}
+FROM places
+WHERE contentid IN ({placeholders})
+"""
+
 DELETE_PLACE = """
 DELETE FROM places WHERE contentid = %s
-"""
\ No newline at end of file
+"""
+
+# 작업 잠금 (여러 워커/호스트 사이에서 하나의 작업만 실행되도록 보장)
+GET_LOCK = """
+SELECT GET_LOCK(%s, %s) AS acquired
+"""
+
+RELEASE_LOCK = """
+SELECT RELEASE_LOCK(%s) AS released
+"""
+
+# 잠금을 보유한 연결이 유휴 시간 초과로 끊기지 않도록 세션 제한 시간을 늘림
+SET_SESSION_WAIT_TIMEOUT = """
+SET SESSION wait_timeout = %s
+"""
+
+# 데이터셋 버전 확인용 (행 수, 마지막 갱신 시각, 갱신 시각의 합 중 하나라도 바뀌면 데이터가 바뀐 것으로 판단)
+# 갱신 시각의 합은 MAX(last_updated)와 같은 초에 다른 행이 수정되어도 바뀜
+SELECT_PLACES_VERSION = """
+SELECT COUNT(*) AS row_count, MAX(last_updated) AS last_updated, SUM(UNIX_TIMESTAMP(last_updated)) AS updated_sum
+FROM places
+"""
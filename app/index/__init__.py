@@ -0,0 +1,5 @@
+from .places_index import (
+    DETAIL_COLUMNS, fetch_places, fetch_place_details, get_places_snapshot, warm_up, is_ready
+)
+from .facet_index import FACET_DIMENSIONS, FacetIndex
+from .suggest_index import SuggestIndex
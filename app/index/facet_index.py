@@ -0,0 +1,183 @@
+import copy
+import threading
+import numpy as np
+
+# 개수를 집계하는 차원 (필터 칩에 표시되는 컬럼)
+FACET_DIMENSIONS = ('cat1', 'cat2', 'contenttypeid', 'sigungucode')
+
+
+def _popcount(bitmap):
+    return bin(bitmap).count('1')
+
+
+# Python 3.10 이상에서는 int.bit_count 사용
+popcount = getattr(int, 'bit_count', _popcount)
+
+
+def to_bitmap(mask):
+    """불리언 배열을 i번째 비트가 i번째 행을 뜻하는 정수 비트맵으로 바꾸는 함수."""
+    return int.from_bytes(np.packbits(np.asarray(mask, dtype=bool), bitorder='little').tobytes(), 'little')
+
+
+class FacetIndex:
+    """
+    스냅샷 데이터의 차원별 값마다 해당하는 행(스냅샷의 행 번호)을 정수 비트맵으로 유지하는 패싯 색인.
+
+    필터 조합의 결과는 비트맵 AND/OR로 구하고, 값별 개수는 비트맵 AND의 비트 수로 계산하므로
+    DataFrame을 다시 훑지 않습니다. 지역(addr1)/동네(addr2) 부분 문자열 조건의 비트맵은 처음 요청될 때 만들어 재사용합니다.
+    """
+
+    MAX_CACHED_PATTERNS = 1024
+
+    def __init__(self, df):
+        # 비트 위치는 df의 인덱스(스냅샷의 행 번호)이며, 처음 만들 때의 df는 0부터 시작하는 연속 인덱스
+        self._segments = [self._segment(df, 0)]
+        self.size = len(df)
+        self.all = (1 << self.size) - 1
+
+        self.bitmaps = {}
+        for dimension in FACET_DIMENSIONS:
+            self.bitmaps[dimension] = self._dimension_bitmaps(df, dimension, 0)
+
+        self._patterns = {}
+        self._patterns_lock = threading.Lock()
+
+    @staticmethod
+    def _segment(df, start):
+        addr1 = df['addr1'].fillna('').astype(str) if 'addr1' in df else None
+        addr2 = df['addr2'].fillna('').astype(str) if 'addr2' in df else None
+        return start, addr1, addr2
+
+    @staticmethod
+    def _dimension_bitmaps(df, dimension, start):
+        values = {}
+        if dimension in df:
+            for value, positions in df.groupby(dimension, sort=False).indices.items():
+                mask = np.zeros(len(df), dtype=bool)
+                mask[positions] = True
+                values[value] = to_bitmap(mask) << start
+        return values
+
+    @staticmethod
+    def _segment_contains(segment, column, pattern):
+        start, addr1, addr2 = segment
+        series = addr1 if column == 'addr1' else addr2
+        if series is None or series.empty:
+            return 0
+        return to_bitmap(series.str.contains(pattern, case=False, regex=False).to_numpy()) << start
+
+    def with_changes(self, removed, added):
+        """
+        행 번호 removed의 비트를 지우고 added(인덱스가 새 행 번호인 DataFrame)의 비트를 더한 새 색인을 반환하는 함수.
+        현재 색인은 바꾸지 않으며, 바뀐 값의 비트맵과 이미 만든 지역/동네 비트맵만 갱신합니다.
+        """
+        index = copy.copy(self)
+        index.bitmaps = {dimension: dict(values) for dimension, values in self.bitmaps.items()}
+        index._patterns_lock = threading.Lock()
+
+        removed_bitmap = 0
+        for position in removed:
+            removed_bitmap |= 1 << int(position)
+        if removed_bitmap:
+            # 지운 행이 속한 값의 비트맵만 바꿈 (지역/동네 비트맵은 counts에서 all과 AND)
+            index.all &= ~removed_bitmap
+            for values in index.bitmaps.values():
+                for value, bitmap in list(values.items()):
+                    if bitmap & removed_bitmap:
+                        bitmap &= ~removed_bitmap
+                        if bitmap:
+                            values[value] = bitmap
+                        else:
+                            del values[value]
+
+        if len(added):
+            start = int(added.index[0])
+            segment = self._segment(added, start)
+            index._segments = self._segments + [segment]
+            index.size = start + len(added)
+            index.all |= ((1 << len(added)) - 1) << start
+            for dimension, values in index.bitmaps.items():
+                for value, bitmap in self._dimension_bitmaps(added, dimension, start).items():
+                    values[value] = values.get(value, 0) | bitmap
+            index._patterns = {
+                (column, pattern): bitmap | self._segment_contains(segment, column, pattern)
+                for (column, pattern), bitmap in list(self._patterns.items())
+            }
+        else:
+            index._patterns = dict(self._patterns)
+        return index
+
+    def _contains(self, column, pattern):
+        key = (column, pattern)
+        bitmap = self._patterns.get(key)
+        if bitmap is None:
+            bitmap = 0
+            for segment in self._segments:
+                bitmap |= self._segment_contains(segment, column, pattern)
+            with self._patterns_lock:
+                if len(self._patterns) >= self.MAX_CACHED_PATTERNS:
+                    self._patterns.clear()
+                self._patterns[key] = bitmap
+        return bitmap
+
+    def area_bitmap(self, region=None, neighborhoods=None):
+        """
+        filter_data_by_preference와 같은 규칙으로 지역/동네 조건의 비트맵을 구하는 함수.
+        지역과 동네가 함께 주어지면 둘 중 하나라도 만족하는 행입니다.
+        """
+        neighborhoods = [neighborhood for neighborhood in neighborhoods or [] if neighborhood]
+        if not region and not neighborhoods:
+            return self.all
+
+        bitmap = 0
+        if region:
+            bitmap |= self._contains('addr1', region)
+        for neighborhood in neighborhoods:
+            bitmap |= self._contains('addr2', neighborhood)
+        # 지역/동네 비트맵에는 변경분으로 지워진 행의 비트가 남아 있을 수 있음
+        return bitmap & self.all
+
+    def dimension_bitmap(self, dimension, values):
+        """한 차원에서 선택된 값들 중 하나라도 해당하는 행의 비트맵을 구하는 함수."""
+        if not values:
+            return self.all
+        bitmap = 0
+        for value in values:
+            bitmap |= self.bitmaps[dimension].get(value, 0)
+        return bitmap
+
+    def counts(self, region=None, neighborhoods=None, filters=None):
+        """
+        필터 조합에 대한 차원별 값의 개수를 계산하는 함수.
+
+        차원별 개수는 그 차원 자신의 선택은 빼고 나머지 조건만 적용하여 계산하므로,
+        이미 선택한 칩 옆의 다른 값을 골랐을 때의 결과 수를 보여줄 수 있습니다.
+
+        Args:
+            region (str): 지역 (addr1 부분 문자열).
+            neighborhoods (list): 동네 (addr2 부분 문자열).
+            filters (dict): {차원: [선택한 값]}.
+
+        Returns:
+            dict: {'total': 모든 조건을 만족하는 행 수, 'facets': {차원: [{'value', 'count'}]}} (개수 내림차순).
+        """
+        filters = filters or {}
+        area = self.area_bitmap(region, neighborhoods)
+        selected = {dimension: self.dimension_bitmap(dimension, filters.get(dimension)) for dimension in FACET_DIMENSIONS}
+
+        total = area
+        for bitmap in selected.values():
+            total &= bitmap
+
+        facets = {}
+        for dimension in FACET_DIMENSIONS:
+            base = area
+            for other, bitmap in selected.items():
+                if other != dimension:
+                    base &= bitmap
+            counts = [
+                {'value': value, 'count': popcount(base & bitmap)} for value, bitmap in self.bitmaps[dimension].items()
+            ]
+            facets[dimension] = sorted(counts, key=lambda item: item['count'], reverse=True)
+
+        return {'total': popcount(total), 'facets': facets}
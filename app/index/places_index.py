@@ -0,0 +1,569 @@
+import copy
+import itertools
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+from ..config.config import Config
+from ..db import execute_query
+from ..db.queries import (
+    SELECT_PLACES_INDEX, SELECT_PLACES_CHANGED, SELECT_PLACES_BY_IDS, SELECT_PLACE_IDS,
+    SELECT_PLACE_DETAILS, SELECT_PLACES_VERSION
+)
+from ..logging import setup_logging
+from ..metrics import CACHE_REQUESTS_TOTAL, PLACES_INDEX_REFRESH_SECONDS
+from .facet_index import FacetIndex
+from .suggest_index import SuggestIndex
+
+# 로그 설정
+logger = setup_logging(__name__)
+
+
+# 스냅샷에 싣지 않고 요청된 행에 대해서만 DB에서 읽는 긴 텍스트 컬럼
+DETAIL_COLUMNS = ('overview', 'overview_summary')
+
+
+def fetch_places(limit=None):
+    """Fetches the columns needed for serving (without long text columns) with an optional limit."""
+    try:
+        query = SELECT_PLACES_INDEX
+        if limit:
+            query += f" LIMIT {limit}"
+        places = execute_query(query)
+        if places is None:
+            raise ValueError("Failed to fetch places from the database.")
+        return places
+    except Exception as e:
+        logger.error(f"Error fetching places: {e}")
+        raise
+
+
+def fetch_changed_places(since):
+    """since 이후에 추가/수정된 행을 조회하는 함수."""
+    places = execute_query(SELECT_PLACES_CHANGED, (since,))
+    if places is None:
+        raise ValueError("Failed to fetch changed places from the database.")
+    return places
+
+
+def fetch_places_by_ids(content_ids):
+    """지정한 contentid들의 행을 fetch_places와 같은 컬럼으로 조회하는 함수."""
+    content_ids = [int(content_id) for content_id in content_ids]
+    if not content_ids:
+        return []
+    query = SELECT_PLACES_BY_IDS.format(placeholders=', '.join(['%s'] * len(content_ids)))
+    places = execute_query(query, tuple(content_ids))
+    if places is None:
+        raise ValueError("Failed to fetch places by id from the database.")
+    return places
+
+
+def fetch_place_ids():
+    """places 테이블의 모든 contentid를 조회하는 함수."""
+    rows = execute_query(SELECT_PLACE_IDS)
+    if rows is None:
+        raise ValueError("Failed to fetch place ids from the database.")
+    return {row['contentid'] for row in rows}
+
+
+def fetch_place_details(content_ids, columns):
+    """
+    지정한 contentid들의 긴 텍스트 컬럼만 조회하는 함수.
+
+    Args:
+        content_ids (list): 조회할 contentid 목록.
+        columns (list): DETAIL_COLUMNS 중 조회할 컬럼.
+
+    Returns:
+        dict: {contentid: {컬럼: 값}}.
+    """
+    columns = [column for column in columns if column in DETAIL_COLUMNS]
+    content_ids = [int(content_id) for content_id in content_ids]
+    if not columns or not content_ids:
+        return {}
+    query = SELECT_PLACE_DETAILS.format(
+        columns=', '.join(columns), placeholders=', '.join(['%s'] * len(content_ids))
+    )
+    rows = execute_query(query, tuple(content_ids))
+    if rows is None:
+        raise ValueError("Failed to fetch place details from the database.")
+    return {row['contentid']: {column: row.get(column) for column in columns} for row in rows}
+
+
+def fetch_dataset_state():
+    """
+    places 테이블의 행 수, 마지막 갱신 시각, 갱신 시각의 합을 조회하는 함수.
+
+    Returns:
+        tuple: (행 수, 마지막 갱신 시각, 갱신 시각의 합). 조회에 실패하면 None.
+    """
+    result = execute_query(SELECT_PLACES_VERSION)
+    if not result:
+        return None
+    row = result[0]
+    return row.get('row_count'), row.get('last_updated'), row.get('updated_sum')
+
+
+def format_version(row_count, last_updated, updated_sum=None):
+    """행 수, 마지막 갱신 시각, 갱신 시각의 합으로 데이터셋 버전 문자열을 만드는 함수."""
+    last_updated = last_updated.isoformat() if hasattr(last_updated, 'isoformat') else str(last_updated)
+    return f"{row_count}-{last_updated}-{updated_sum}"
+
+
+def fetch_dataset_version():
+    """
+    places 테이블의 데이터셋 버전을 조회하는 함수.
+
+    Returns:
+        str: 행 수와 마지막 갱신 시각으로 만든 버전 문자열. 조회에 실패하면 None.
+    """
+    state = fetch_dataset_state()
+    return format_version(*state) if state else None
+
+
+def split_texts(df):
+    """df에서 combined_text를 떼어 (combined_text가 없는 df, 텍스트 Series)로 반환하는 함수."""
+    if 'combined_text' in df:
+        return df.drop(columns=['combined_text']), df['combined_text'].fillna('').astype(str)
+    return df, pd.Series('', index=df.index, dtype=object)
+
+
+class AppendOnlyArray:
+    """
+    스냅샷 사이에 공유하는 1차원 numpy 배열.
+
+    스냅샷은 자신이 만들어질 때의 길이까지만 읽고 새 값은 그 뒤에 기록하므로, 이전 스냅샷이 보는 구간은
+    바뀌지 않습니다. 공간이 부족하면 두 배로 늘리므로 덧붙이는 비용은 덧붙이는 값의 수에 비례합니다.
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values)
+        self.buffer = np.empty(max(16, len(values) * 2), dtype=values.dtype)
+        self.buffer[:len(values)] = values
+
+    def put(self, start, values):
+        """start 위치부터 values를 기록하는 함수 (필요하면 공간을 늘림)."""
+        end = start + len(values)
+        if end > len(self.buffer):
+            buffer = np.empty(max(end, len(self.buffer) * 2), dtype=self.buffer.dtype)
+            buffer[:start] = self.buffer[:start]
+            self.buffer = buffer
+        self.buffer[start:end] = values
+
+    def view(self, length):
+        return self.buffer[:length]
+
+
+class SnapshotLineage:
+    """
+    한 번의 전체 구성과 그 뒤에 변경분을 반영한 스냅샷들이 공유하는 상태.
+
+    - rows: contentid -> (행 번호, last_updated). 최신 스냅샷 기준이며 변경분을 반영할 때만 갱신합니다.
+    - has_text: 행 번호별 텍스트 존재 여부 (추가 전용).
+    - dead: 행 번호별로 그 행이 삭제/교체된 세대. 세대 g의 스냅샷은 dead > g인 행만 살아 있는 것으로 봅니다.
+      이전 세대의 스냅샷에는 영향이 없으므로 읽고 있는 요청을 방해하지 않습니다.
+    """
+
+    ALIVE = np.iinfo(np.int64).max
+
+    def __init__(self, rows, has_text):
+        self.rows = rows
+        self.has_text = AppendOnlyArray(has_text)
+        self.dead = AppendOnlyArray(np.full(len(has_text), self.ALIVE, dtype=np.int64))
+        self.head = 0
+
+
+class PlacesSnapshot:
+    """
+    특정 시점의 places 데이터와 combined_text의 TF-IDF 색인을 묶은 읽기 전용 스냅샷.
+
+    데이터는 전체 구성 때 만든 기본 조각과 변경분마다 덧붙인 조각(frames, matrices)으로 이루어지며,
+    각 조각의 인덱스는 TF-IDF 행 번호입니다. 수정 전 행과 삭제된 행은 지우지 않고 세대별 tombstone으로 표시하므로
+    변경분을 반영하는 비용은 변경된 행 수에 비례하고, 이전 스냅샷은 그대로 유지됩니다.
+    combined_text는 색인을 만든 뒤 버리고, 텍스트가 있는 행인지 여부(has_text)만 유지합니다.
+    자동완성용 접두어 색인(suggest_index)과 필터별 개수를 위한 패싯 색인(facet_index)도 같은 데이터로 함께 만들고,
+    변경분은 두 색인에도 바뀐 행만 반영합니다.
+    """
+
+    # 변경분 조각이 이보다 많아지면 변경분 조각끼리 합침 (기본 조각은 그대로)
+    MAX_SEGMENTS = 8
+
+    def __init__(self, df, version):
+        # scikit-learn은 색인을 만들 때만 불러옴
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        df, texts = split_texts(df.reset_index(drop=True))
+        self.version = version
+        self.loaded_at = time.time()
+        self.fitted_at = self.loaded_at
+        self.deltas = 0
+        self.generation = 0
+        self.total_rows = len(df)
+        self.size = len(df)
+        self.frames = [df]
+        self.matrices = []
+        self.vectorizer = None
+
+        has_text = (texts.str.strip() != '').to_numpy()
+        if has_text.any():
+            self.vectorizer = TfidfVectorizer(stop_words=None)
+            self.matrices = [self.vectorizer.fit_transform(texts)]
+
+        last_updated = df['last_updated'] if 'last_updated' in df else pd.Series(pd.NaT, index=df.index)
+        rows = dict(zip(df['contentid'], zip(df.index, last_updated))) if 'contentid' in df else {}
+        self.lineage = SnapshotLineage(rows, has_text)
+        watermark = last_updated.max() if len(df) else None
+        self.watermark = None if pd.isna(watermark) else pd.Timestamp(watermark).to_pydatetime()
+        self.suggest_index = SuggestIndex.from_dataframe(df)
+        self.facet_index = FacetIndex(df)
+        self._df = df
+
+    @property
+    def has_text(self):
+        """행 번호별 텍스트 존재 여부."""
+        return self.lineage.has_text.view(self.total_rows)
+
+    @property
+    def dead_rows(self):
+        """행렬에는 남아 있지만 삭제/교체되어 보이지 않는 행 수."""
+        return self.total_rows - self.size
+
+    def is_alive(self, positions):
+        """행 번호들이 이 스냅샷에서 살아 있는지 반환하는 함수."""
+        return self.lineage.dead.view(self.total_rows)[positions] > self.generation
+
+    def select(self, select_rows):
+        """
+        각 조각에 select_rows(df -> df)를 적용하고 삭제/교체된 행을 뺀 결과를 합쳐 반환하는 함수.
+        조건으로 먼저 줄인 뒤 tombstone을 확인하므로 요청마다 전체 데이터를 복사하지 않습니다.
+        """
+        parts = []
+        for frame in self.frames:
+            part = select_rows(frame)
+            if self.dead_rows and len(part):
+                part = part[self.is_alive(part.index.to_numpy())]
+            parts.append(part)
+        non_empty = [part for part in parts if len(part)]
+        if len(non_empty) > 1:
+            return pd.concat(non_empty)
+        return non_empty[0] if non_empty else parts[0]
+
+    @property
+    def df(self):
+        """살아 있는 모든 행의 DataFrame (처음 접근할 때 만듦. 요청 처리에서는 select를 사용)."""
+        if self._df is None:
+            self._df = self.select(lambda frame: frame)
+        return self._df
+
+    def drop_unchanged(self, changed):
+        """changed 중 contentid와 last_updated가 스냅샷과 같은(이미 반영된) 행을 제외하는 함수."""
+        if changed.empty or 'contentid' not in changed or 'last_updated' not in changed:
+            return changed
+        rows = self.lineage.rows
+        unchanged = [
+            content_id in rows and rows[content_id][1] == last_updated
+            for content_id, last_updated in zip(changed['contentid'], pd.to_datetime(changed['last_updated']))
+        ]
+        return changed[~np.array(unchanged, dtype=bool)]
+
+    def apply_changes(self, changed, deleted_ids, version):
+        """
+        변경분만 반영한 새 스냅샷을 만드는 함수. 현재 스냅샷은 바꾸지 않으므로 읽고 있는 요청에 영향이 없습니다.
+
+        추가/수정된 행은 기존 어휘와 IDF 가중치로 벡터화하여 새 조각으로 덧붙이고, 수정 전 행과 삭제된 행은
+        새 세대의 tombstone으로 표시하여 다음 전체 재구성 때까지 남겨 둡니다. 같은 contentid가 changed와
+        deleted_ids에 모두 있으면 DB에서 읽은 changed를 따릅니다.
+
+        Args:
+            changed (DataFrame): fetch_places와 같은 컬럼의 추가/수정된 행.
+            deleted_ids (iterable): 삭제된 contentid.
+            version (str): 변경분을 반영한 데이터셋 버전.
+
+        Returns:
+            PlacesSnapshot: 새 스냅샷.
+        """
+        import scipy.sparse as sp
+
+        lineage = self.lineage
+        if self.vectorizer is None:
+            raise ValueError("Snapshot has no fitted vectorizer.")
+        if self.generation != lineage.head:
+            raise ValueError("Changes can only be applied to the latest snapshot.")
+
+        if changed.empty or 'contentid' not in changed:
+            changed = pd.DataFrame(columns=self.frames[0].columns.tolist() + ['combined_text'])
+        changed = changed.drop_duplicates('contentid', keep='last')
+        changed.index = pd.RangeIndex(self.total_rows, self.total_rows + len(changed))
+        changed, texts = split_texts(changed)
+        changed_ids = set(changed['contentid'])
+        deleted_ids = set(deleted_ids) - changed_ids
+        stale = [
+            lineage.rows[content_id][0]
+            for content_id in itertools.chain(changed['contentid'], deleted_ids)
+            if content_id in lineage.rows
+        ]
+        generation = self.generation + 1
+
+        # 새 조각의 벡터와 색인을 먼저 만들고, 공유 상태는 마지막에 한꺼번에 갱신
+        snapshot = copy.copy(self)
+        snapshot.version = version
+        snapshot.loaded_at = time.time()
+        snapshot.deltas = self.deltas + 1
+        snapshot.generation = generation
+        snapshot.total_rows = self.total_rows + len(changed)
+        snapshot.size = self.size - len(stale) + len(changed)
+        snapshot._df = None
+        snapshot.frames = self.frames[:]
+        snapshot.matrices = self.matrices[:]
+        if len(changed):
+            snapshot.frames.append(changed)
+            snapshot.matrices.append(self.vectorizer.transform(texts))
+            if len(snapshot.frames) > self.MAX_SEGMENTS:
+                snapshot.frames[1:] = [pd.concat(snapshot.frames[1:])]
+                snapshot.matrices[1:] = [sp.vstack(snapshot.matrices[1:], format='csr')]
+        removed = self._rows_at(stale)
+        snapshot.facet_index = self.facet_index.with_changes(stale, changed)
+        snapshot.suggest_index = self.suggest_index.with_changes(removed, changed, snapshot.is_alive)
+        if len(changed) and 'last_updated' in changed:
+            watermark = pd.to_datetime(changed['last_updated']).max()
+            if not pd.isna(watermark) and (self.watermark is None or watermark > self.watermark):
+                snapshot.watermark = pd.Timestamp(watermark).to_pydatetime()
+
+        lineage.has_text.put(self.total_rows, (texts.str.strip() != '').to_numpy())
+        lineage.dead.put(self.total_rows, np.full(len(changed), SnapshotLineage.ALIVE, dtype=np.int64))
+        if stale:
+            lineage.dead.buffer[stale] = generation
+        for content_id in deleted_ids:
+            lineage.rows.pop(content_id, None)
+        last_updated = changed['last_updated'] if 'last_updated' in changed else [pd.NaT] * len(changed)
+        for content_id, row, updated in zip(changed['contentid'], changed.index, pd.to_datetime(last_updated)):
+            lineage.rows[content_id] = (row, updated)
+        lineage.head = generation
+        return snapshot
+
+    def _segments(self):
+        # (시작 행 번호, 조각 DataFrame, 조각 행렬). 조각의 인덱스는 시작 행 번호부터 연속
+        start = 0
+        for frame, matrix in itertools.zip_longest(self.frames, self.matrices):
+            yield start, frame, matrix
+            start += len(frame)
+
+    def _rows_at(self, positions):
+        """행 번호들의 행을 조각에서 찾아 반환하는 함수."""
+        positions = np.asarray(positions, dtype=np.int64)
+        parts = []
+        for start, frame, _ in self._segments():
+            selected = positions[(positions >= start) & (positions < start + len(frame))]
+            if len(selected):
+                parts.append(frame.iloc[selected - start])
+        return pd.concat(parts) if parts else self.frames[0].iloc[:0]
+
+    def similarity(self, positions, text):
+        """
+        주어진 행 번호들에 대해 text와의 코사인 유사도를 계산하는 함수.
+        TF-IDF 행 벡터는 L2 정규화되어 있으므로 내적이 곧 코사인 유사도입니다.
+
+        Args:
+            positions (array-like): TF-IDF 행 번호 (조각 DataFrame의 인덱스).
+            text (str): 사용자 입력 텍스트.
+
+        Returns:
+            ndarray: 행 번호 순서대로의 유사도.
+        """
+        positions = np.asarray(positions)
+        result = np.zeros(len(positions))
+        if self.vectorizer is None:
+            return result
+        user_vector = self.vectorizer.transform([text]).T
+        for start, _, matrix in self._segments():
+            selected = (positions >= start) & (positions < start + matrix.shape[0])
+            if selected.any():
+                result[selected] = (matrix[positions[selected] - start] @ user_vector).toarray().ravel()
+        return result
+
+
+class PlacesIndex:
+    """
+    places 스냅샷을 메모리에 유지하고, 데이터셋 버전이 바뀌면 백그라운드에서 교체하는 관리자.
+    요청은 항상 현재 스냅샷을 읽기만 하므로 DB 조회나 색인 생성을 기다리지 않습니다.
+
+    버전이 바뀌면 마지막 갱신 시각 이후의 변경분만 읽어 반영하고, 변경분이 쌓이면(compact_ratio, compact_seconds)
+    전체를 다시 읽어 IDF 가중치를 새로 계산합니다.
+    """
+
+    RETRY_SECONDS = 5
+
+    def __init__(self, refresh_seconds, compact_seconds=3600, compact_ratio=0.2):
+        self.refresh_seconds = refresh_seconds
+        self.compact_seconds = compact_seconds
+        self.compact_ratio = compact_ratio
+        self._snapshot = None
+        self._load_lock = threading.RLock()
+        self._refresher_lock = threading.Lock()
+        self._refresher_pid = None
+        # 이 프로세스가 스냅샷을 넘겨받은(fork) 시각. 변경분 누적 시간은 이 시각부터 셈
+        self._adopted_at = 0
+
+    def load(self):
+        """DB에서 전체 데이터를 읽어 새 스냅샷을 만들고 교체하는 함수."""
+        with self._load_lock:
+            version = fetch_dataset_version()
+            started = time.perf_counter()
+            with PLACES_INDEX_REFRESH_SECONDS.time(kind='full'):
+                snapshot = PlacesSnapshot(pd.DataFrame(fetch_places()), version)
+            self._snapshot = snapshot
+            logger.info(
+                f"Places snapshot loaded: {snapshot.size} rows, version {version}, "
+                f"{time.perf_counter() - started:.2f}s."
+            )
+            return snapshot
+
+    def get(self):
+        """현재 스냅샷을 반환하는 함수. 아직 없으면 즉시 불러옵니다."""
+        self._ensure_refresher()
+        snapshot = self._snapshot
+        if snapshot is not None:
+            CACHE_REQUESTS_TOTAL.inc(cache='places_snapshot', result='hit')
+            return snapshot
+        CACHE_REQUESTS_TOTAL.inc(cache='places_snapshot', result='miss')
+        with self._load_lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            return self.load()
+
+    def is_ready(self):
+        """
+        스냅샷이 준비되었는지 반환하는 함수.
+        준비 전에는 readiness 검사만 들어오므로, 여기서 백그라운드 갱신 스레드를 시작하여 불러오기를 재시도합니다.
+        """
+        self._ensure_refresher()
+        return self._snapshot is not None
+
+    def apply_delta(self, row_count, version):
+        """
+        현재 스냅샷의 마지막 갱신 시각 이후에 바뀐 행만 읽어 새 스냅샷으로 교체하는 함수.
+
+        변경분을 반영한 뒤의 행 수가 DB의 행 수(row_count)와 다르면 contentid 목록을 비교하여
+        삭제된 행을 빼고, 갱신 시각으로 찾지 못한 행(늦게 커밋된 트랜잭션 등)을 추가로 읽습니다.
+        """
+        with self._load_lock:
+            snapshot = self._snapshot
+            started = time.perf_counter()
+            with PLACES_INDEX_REFRESH_SECONDS.time(kind='delta'):
+                changed = snapshot.drop_unchanged(pd.DataFrame(fetch_changed_places(snapshot.watermark)))
+                changed_ids = set(changed['contentid']) if 'contentid' in changed else set()
+                known = snapshot.lineage.rows
+                deleted_ids = set()
+                if snapshot.size + sum(content_id not in known for content_id in changed_ids) != row_count:
+                    # 행 수가 맞지 않을 때만 전체 contentid를 비교
+                    db_ids = fetch_place_ids()
+                    known_ids = known.keys()
+                    deleted_ids = known_ids - db_ids
+                    missing_ids = db_ids - known_ids - changed_ids
+                    if missing_ids:
+                        changed = pd.concat([changed, pd.DataFrame(fetch_places_by_ids(missing_ids))])
+                self._snapshot = snapshot.apply_changes(changed, deleted_ids, version)
+            logger.info(
+                f"Places delta applied: {len(changed)} upserted, {len(deleted_ids)} deleted, "
+                f"version {version}, {time.perf_counter() - started:.2f}s."
+            )
+            return self._snapshot
+
+    def needs_compaction(self, snapshot):
+        """변경분이 반영된 스냅샷을 전체 재구성(IDF 재계산)해야 하는지 반환하는 함수."""
+        if snapshot.deltas == 0:
+            return False
+        if snapshot.dead_rows > self.compact_ratio * snapshot.total_rows:
+            return True
+        return time.time() - max(snapshot.fitted_at, self._adopted_at) >= self.compact_seconds
+
+    def refresh_if_changed(self):
+        """데이터셋 버전이 바뀌었으면 변경분을 반영하고, 변경분이 충분히 쌓였으면 스냅샷을 다시 만드는 함수."""
+        state = fetch_dataset_state()
+        if state is None:
+            return False
+        version = format_version(*state)
+        snapshot = self._snapshot
+        refreshed = False
+
+        if snapshot is not None and snapshot.version != version:
+            if snapshot.watermark is None or snapshot.vectorizer is None:
+                snapshot = None
+            else:
+                try:
+                    snapshot = self.apply_delta(state[0], version)
+                    refreshed = True
+                except Exception as e:
+                    logger.warning(f"Failed to apply places delta, rebuilding: {e}")
+                    snapshot = None
+
+        if snapshot is None or self.needs_compaction(snapshot):
+            self.load()
+            return True
+        return refreshed
+
+    def _refresh_loop(self):
+        while True:
+            if self._snapshot is None:
+                # 시작 시 불러오기에 실패했으면(DB 연결 실패 등) 짧은 간격으로 다시 시도
+                time.sleep(self.RETRY_SECONDS)
+            elif self.refresh_seconds > 0:
+                time.sleep(self.refresh_seconds)
+            else:
+                # 주기적 갱신이 꺼져 있으면 처음 불러온 뒤 종료
+                return
+            try:
+                self.refresh_if_changed()
+            except Exception as e:
+                logger.warning(f"Failed to refresh places snapshot: {e}")
+
+    def _ensure_refresher(self):
+        # pre-fork 서버에서는 마스터에서 시작한 스레드가 워커로 복제되지 않으므로 프로세스마다 시작
+        if (self.refresh_seconds <= 0 and self._snapshot is not None) or self._refresher_pid == os.getpid():
+            return
+        with self._refresher_lock:
+            if self._refresher_pid == os.getpid():
+                return
+            if self._snapshot is not None:
+                # 마스터가 부팅 때 만든 스냅샷은 갱신되지 않으므로, 새로 fork된 워커는 요청을 처리하기 전에 버전을 맞춤
+                # (교체된 워커마다 전체 재구성을 하지 않도록 변경분 누적 시간은 지금부터 셈)
+                self._adopted_at = time.time()
+                try:
+                    self.refresh_if_changed()
+                except Exception as e:
+                    logger.warning(f"Failed to refresh inherited places snapshot: {e}")
+            self._refresher_pid = os.getpid()
+            threading.Thread(target=self._refresh_loop, name='places-index-refresher', daemon=True).start()
+
+
+# 프로세스 전역 색인
+places_index = PlacesIndex(
+    Config.PLACES_REFRESH_SECONDS, Config.PLACES_COMPACT_SECONDS, Config.PLACES_COMPACT_RATIO
+)
+
+
+def get_places_snapshot():
+    """현재 places 스냅샷을 반환하는 함수."""
+    return places_index.get()
+
+
+def warm_up():
+    """
+    places 스냅샷과 TF-IDF 색인을 미리 만들어 두는 함수.
+    서버가 요청을 받기 전에 호출하면 첫 요청부터 DB 조회와 색인 생성 비용이 없습니다.
+
+    Returns:
+        bool: 준비 성공 여부.
+    """
+    try:
+        places_index.load()
+        return True
+    except Exception as e:
+        logger.error(f"Failed to warm up places index: {e}")
+        return False
+
+
+def is_ready():
+    """places 스냅샷이 준비되어 요청을 처리할 수 있는지 반환하는 함수."""
+    return places_index.is_ready()
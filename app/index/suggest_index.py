@@ -0,0 +1,292 @@
+import bisect
+import copy
+import heapq
+import re
+import threading
+import numpy as np
+
+# 한글 음절 범위와 초성 목록 (음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+SYLLABLES_PER_INITIAL = 21 * 28
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+CHOSUNG_INDEX = {jamo: i for i, jamo in enumerate(CHOSUNG)}
+
+# 받침(종성) 인덱스별로 다음 글자의 초성으로 넘어갈 수 있는 자음: (남는 받침 인덱스, 다음 초성)
+# 겹받침은 앞 자음이 받침으로 남고 뒤 자음이 넘어감 (예: '닭' -> '달' + 'ㄱ')
+JONGSEONG_SPLITS = {
+    1: (0, 'ㄱ'), 2: (0, 'ㄲ'), 3: (1, 'ㅅ'), 4: (0, 'ㄴ'), 5: (4, 'ㅈ'), 6: (4, 'ㅎ'), 7: (0, 'ㄷ'),
+    8: (0, 'ㄹ'), 9: (8, 'ㄱ'), 10: (8, 'ㅁ'), 11: (8, 'ㅂ'), 12: (8, 'ㅅ'), 13: (8, 'ㅌ'), 14: (8, 'ㅍ'),
+    15: (8, 'ㅎ'), 16: (0, 'ㅁ'), 17: (0, 'ㅂ'), 18: (17, 'ㅅ'), 19: (0, 'ㅅ'), 20: (0, 'ㅆ'), 21: (0, 'ㅇ'),
+    22: (0, 'ㅈ'), 23: (0, 'ㅊ'), 24: (0, 'ㅋ'), 25: (0, 'ㅌ'), 26: (0, 'ㅍ'), 27: (0, 'ㅎ'),
+}
+
+# 정렬된 키 범위의 상한을 만들기 위한 가장 큰 문자
+MAX_CHAR = '\U0010ffff'
+
+# 콘텐츠 타입별 기본 인기도 (관광지/문화시설/축제를 숙박/쇼핑보다 먼저 제안)
+CONTENT_TYPE_WEIGHTS = {
+    '관광지': 3.0, '문화시설': 2.5, '축제공연행사': 2.5, '음식점': 2.0,
+    '레포츠': 1.5, '여행코스': 1.5, '쇼핑': 1.0, '숙박': 1.0,
+}
+
+re_spaces = re.compile(r'\s+')
+re_neighborhood = re.compile(r'[가-힣0-9]+(?:동|읍|면|리|가)(?=$|[\s,)])')
+
+
+def normalize(text):
+    """검색 키로 쓰기 위해 소문자로 바꾸고 공백을 제거하는 함수."""
+    return re_spaces.sub('', str(text).lower())
+
+
+def to_chosung(text):
+    """한글 음절을 초성으로 바꾼 문자열을 반환하는 함수 (예: '대전' -> 'ㄷㅈ')."""
+    return ''.join(
+        CHOSUNG[(ord(char) - HANGUL_BASE) // SYLLABLES_PER_INITIAL]
+        if HANGUL_BASE <= ord(char) <= HANGUL_LAST else char
+        for char in text
+    )
+
+
+def jongseong_split(char):
+    """
+    받침이 있는 음절에서 받침이 다음 글자의 초성으로 넘어가는 경우의 (받침을 뺀 음절, 다음 초성)을 반환하는 함수.
+    IME는 '서구'를 입력하는 도중에 '석'을 보여주므로 '석'은 '서' + 'ㄱ'으로 시작하는 글자로도 이어질 수 있습니다.
+    받침이 없거나 한글 음절이 아니면 None.
+    """
+    code = ord(char)
+    if not HANGUL_BASE <= code <= HANGUL_LAST:
+        return None
+    jongseong = (code - HANGUL_BASE) % 28
+    if jongseong == 0:
+        return None
+    remaining, initial = JONGSEONG_SPLITS[jongseong]
+    return chr(code - jongseong + remaining), initial
+
+
+def last_char_range(char):
+    """
+    입력 중인 마지막 글자가 완성될 수 있는 음절 범위를 반환하는 함수.
+
+    - 초성만 입력된 경우('ㅈ'): 그 초성으로 시작하는 모든 음절 ('자'~'짛')
+    - 받침 없는 음절('저'): 같은 초성과 중성에 받침이 붙은 음절까지 ('저'~'젛')
+    - 그 외: 글자 그대로 (받침이 다음 글자로 넘어가는 경우는 jongseong_split에서 처리)
+    """
+    if char in CHOSUNG_INDEX:
+        first = HANGUL_BASE + CHOSUNG_INDEX[char] * SYLLABLES_PER_INITIAL
+        return chr(first), chr(first + SYLLABLES_PER_INITIAL - 1)
+    code = ord(char)
+    if HANGUL_BASE <= code <= HANGUL_LAST and (code - HANGUL_BASE) % 28 == 0:
+        return char, chr(code + 27)
+    return char, char
+
+
+class PrefixKeys:
+    """이름과 초성 문자열을 정렬된 배열로 유지하고 접두어에 맞는 항목 번호를 찾는 색인."""
+
+    def __init__(self, keys):
+        # keys: (표시 이름, 항목 번호) 리스트
+        text_keys = sorted((normalize(text), i) for text, i in keys)
+        chosung_keys = sorted((to_chosung(key), i) for key, i in text_keys)
+        self.text_keys = [key for key, _ in text_keys]
+        self.text_ids = [i for _, i in text_keys]
+        self.chosung_keys = [key for key, _ in chosung_keys]
+        self.chosung_ids = [i for _, i in chosung_keys]
+
+    def _range(self, keys, low, high):
+        return bisect.bisect_left(keys, low), bisect.bisect_left(keys, high + MAX_CHAR)
+
+    def candidates(self, query):
+        """정규화된 query로 시작할 수 있는 항목 번호를 반환하는 함수."""
+        if all(char in CHOSUNG_INDEX for char in query):
+            start, end = self._range(self.chosung_keys, query, query)
+            return self.chosung_ids[start:end]
+        low, high = last_char_range(query[-1])
+        start, end = self._range(self.text_keys, query[:-1] + low, query[:-1] + high)
+        ids = self.text_ids[start:end]
+        split = jongseong_split(query[-1])
+        if split:
+            # 받침이 다음 글자의 초성이 되는 경우 ('석' -> '서' + 'ㄱ'으로 시작하는 글자)
+            low, high = last_char_range(split[1])
+            prefix = query[:-1] + split[0]
+            start, end = self._range(self.text_keys, prefix + low, prefix + high)
+            ids = ids + self.text_ids[start:end]
+        return ids
+
+    def short_prefixes(self):
+        """범위가 넓어 미리 계산할 짧은 접두어 (한 글자의 완성 음절/받침 입력 전 음절/초성, 두 글자 초성)."""
+        queries = set()
+        for key in self.text_keys:
+            if not key:
+                continue
+            char = key[0]
+            queries.add(char)
+            code = ord(char)
+            if HANGUL_BASE <= code <= HANGUL_LAST:
+                queries.add(chr(code - (code - HANGUL_BASE) % 28))
+        for key in self.chosung_keys:
+            queries.add(key[:1])
+            queries.add(key[:2])
+        queries.discard('')
+        return queries
+
+
+class SuggestIndex:
+    """
+    장소 제목, 자치구, 법정동 이름에 대한 접두어 자동완성 색인.
+
+    정규화된 이름과 초성 문자열을 각각 정렬된 배열로 유지하고, 이진 탐색으로 접두어 범위를 찾은 뒤
+    인기도가 높은 순으로 상위 k개를 반환합니다. 범위가 넓은 짧은 접두어의 상위 후보는 색인을 만들 때 미리 계산합니다.
+
+    장소 항목 번호는 스냅샷의 행 번호와 같습니다. 변경분은 추가된 장소만 따로 정렬하여 덧붙이고(with_changes),
+    삭제/교체된 장소는 스냅샷이 넘겨준 is_alive로 걸러내므로 처음 만든 정렬 배열은 다시 만들지 않습니다.
+    지역 이름은 장소 수가 인기도이므로 개수만 갱신하여 (장소보다 훨씬 적은) 지역 색인을 다시 만듭니다.
+    """
+
+    DEFAULT_LIMIT = 10
+    MAX_CACHED_QUERIES = 20000
+    # 짧은 접두어마다 미리 계산해 두는 장소 후보 수 (삭제된 장소를 걸러낸 뒤에도 충분하도록 limit보다 크게)
+    TOP_CANDIDATES = 50
+
+    def __init__(self, entries, area_counts=None):
+        # entries: 행 번호별 (표시 이름, 종류, 인기도, contentid). 이름이 없는 행은 색인하지 않음
+        # area_counts: {(지역 이름, 종류): 장소 수}
+        self.entries = entries
+        self.weights = [entry[2] for entry in entries]
+        self._base = PrefixKeys((entry[0], i) for i, entry in enumerate(entries) if entry[0])
+        self._added = None
+        self._added_rows = []
+        self._is_alive = None
+        self._set_areas(area_counts or {})
+
+        self._top = {}
+        for query in self._base.short_prefixes():
+            self._top[query] = heapq.nlargest(
+                self.TOP_CANDIDATES, self._base.candidates(query), key=self.weights.__getitem__
+            )
+
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _place_entry(row):
+        title = getattr(row, 'title', None)
+        weight = CONTENT_TYPE_WEIGHTS.get(getattr(row, 'contenttypeid', None), 1.0)
+        if getattr(row, 'firstimage', None):
+            weight += 0.5
+        return title or None, 'place', weight, getattr(row, 'contentid', None)
+
+    @staticmethod
+    def _count_areas(df, area_counts, step):
+        for row in df.itertuples(index=False):
+            areas = set(re_neighborhood.findall(getattr(row, 'addr2', None) or ''))
+            keys = [(neighborhood, 'neighborhood') for neighborhood in areas]
+            region = getattr(row, 'sigungucode', None)
+            if region:
+                keys.append((region, 'region'))
+            for key in keys:
+                count = area_counts.get(key, 0) + step
+                if count > 0:
+                    area_counts[key] = count
+                else:
+                    area_counts.pop(key, None)
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """places 데이터프레임(title, addr1, addr2, sigungucode, contenttypeid, firstimage)으로 색인을 만드는 함수."""
+        entries = [cls._place_entry(row) for row in df.itertuples(index=False)]
+        area_counts = {}
+        cls._count_areas(df, area_counts, 1)
+        return cls(entries, area_counts)
+
+    def _set_areas(self, area_counts):
+        # 지역 이름은 속한 장소 수를 인기도로 사용하여 개별 장소보다 먼저 제안
+        self._area_counts = area_counts
+        self._area_entries = [(name, kind, 10.0 + count, None) for (name, kind), count in area_counts.items()]
+        self._areas = PrefixKeys((entry[0], i) for i, entry in enumerate(self._area_entries))
+
+    def with_changes(self, removed, added, is_alive):
+        """
+        변경분을 반영한 새 색인을 반환하는 함수. 현재 색인은 바꾸지 않습니다.
+
+        Args:
+            removed (DataFrame): 삭제/교체된 행.
+            added (DataFrame): 추가/수정된 행 (인덱스가 새 행 번호이며 기존 행 번호 뒤에 이어짐).
+            is_alive (callable): 행 번호 배열 -> 새 스냅샷에서 살아 있는지 여부 배열.
+        """
+        index = copy.copy(self)
+        index._is_alive = is_alive
+        index._cache = {}
+        index._cache_lock = threading.Lock()
+
+        if len(added):
+            # 행 번호와 항목 번호를 맞추기 위해 공유 리스트의 해당 위치부터 기록
+            # (이전 색인은 자신이 아는 번호만 읽으며, 그 뒤는 반영에 실패한 변경분의 항목일 수 있음)
+            del self.entries[added.index[0]:]
+            del self.weights[added.index[0]:]
+        for row in added.itertuples(index=False):
+            entry = self._place_entry(row)
+            self.entries.append(entry)
+            self.weights.append(entry[2])
+        if len(added):
+            index._added_rows = self._added_rows + added.index.tolist()
+            index._added = PrefixKeys(
+                (self.entries[i][0], i) for i in index._added_rows if self.entries[i][0]
+            )
+
+        area_counts = dict(self._area_counts)
+        self._count_areas(removed, area_counts, -1)
+        self._count_areas(added, area_counts, 1)
+        index._set_areas(area_counts)
+        return index
+
+    def _alive(self, ids):
+        if self._is_alive is None or not ids:
+            return ids
+        alive = self._is_alive(np.asarray(ids, dtype=np.int64))
+        return [i for i, keep in zip(ids, alive) if keep]
+
+    def _search(self, query, limit):
+        top = self._top.get(query)
+        ids = self._alive(top) if top is not None else None
+        if ids is None or (len(ids) < limit and len(top) == self.TOP_CANDIDATES):
+            # 미리 계산한 후보가 삭제로 부족해지면 전체 범위에서 다시 찾음
+            ids = self._alive(self._base.candidates(query))
+        if self._added is not None:
+            ids = ids + self._alive(self._added.candidates(query))
+
+        places = [(self.weights[i], self.entries[i]) for i in heapq.nlargest(limit, ids, key=self.weights.__getitem__)]
+        areas = [(entry[2], entry) for entry in map(self._area_entries.__getitem__, self._areas.candidates(query))]
+        top = heapq.nlargest(limit, areas + places, key=lambda candidate: candidate[0])
+        return [self._to_result(entry) for _, entry in top]
+
+    def _to_result(self, entry):
+        text, kind, _, content_id = entry
+        result = {'text': text, 'type': kind}
+        if content_id is not None:
+            result['contentid'] = content_id
+        return result
+
+    def suggest(self, query, limit=DEFAULT_LIMIT):
+        """
+        접두어에 맞는 자동완성 후보를 인기도 순으로 반환하는 함수.
+
+        Args:
+            query (str): 입력 중인 검색어. 완성되지 않은 마지막 글자와 초성만 입력한 경우도 처리합니다.
+            limit (int): 반환할 최대 후보 수.
+
+        Returns:
+            list: {'text', 'type', 'contentid'(장소인 경우)} dict 리스트.
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        key = (query, limit)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._search(query, limit)
+            with self._cache_lock:
+                if len(self._cache) >= self.MAX_CACHED_QUERIES:
+                    self._cache.clear()
+                self._cache[key] = result
+        return result
@@ -1 +1 @@
-from .logging_config import setup_logging
+from .logging_config import setup_logging, stop_logging
@@ -1,5 +1,22 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+from ..config.config import Config
+from ..metrics import Counter
+
+# 로그 큐가 가득 차서 버려진 레코드 수
+LOG_RECORDS_DROPPED_TOTAL = Counter(
+    'gayou_log_records_dropped_total', 'Log records dropped because the log queue was full.')
+
+# 로깅은 프로세스당 한 번만 구성
+_setup_lock = threading.Lock()
+_listener = None
+_queue_handler = None
+_configured = False
+
 
 class ColoredFormatter(logging.Formatter):
     """Colored log formatter for terminal output."""
@@ -14,43 +31,169 @@ class ColoredFormatter(logging.Formatter):
 
     RESET = '\033[0m'
 
+    def __init__(self):
+        super().__init__()
+        # 레벨별 포맷터를 미리 만들어 두고 레코드마다 재사용
+        self._formatters = {
+            level: logging.Formatter(f"{color}%(asctime)s - %(levelname)s - %(message)s{self.RESET}")
+            for level, color in self.COLORS.items()
+        }
+        self._default = logging.Formatter(f"{self.RESET}%(asctime)s - %(levelname)s - %(message)s{self.RESET}")
+
     def format(self, record):
         """
         로그 레코드를 색상으로 포맷합니다.
         로그 메시지의 레벨에 따라 다른 색상을 적용합니다.
         """
-        log_fmt = f"{self.COLORS.get(record.levelname, self.RESET)}%(asctime)s - %(levelname)s - %(message)s{self.RESET}"
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        return self._formatters.get(record.levelname, self._default).format(record)
+
 
-def setup_logging():
+class DebugSamplingFilter(logging.Filter):
     """
-    로깅 설정을 구성하는 함수.
-    콘솔에 컬러 로그를 출력하도록 설정하고, 파일에 로그를 기록합니다.
+    DEBUG 레코드를 호출 위치(파일, 줄 번호)별로 every건 중 1건만 통과시키는 필터.
+    반복문 안의 대량 디버그 로그가 로깅 비용을 지배하지 않도록 합니다.
+    """
+
+    def __init__(self, every):
+        super().__init__()
+        self.every = max(1, every)
+        self._counts = {}
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        key = (record.pathname, record.lineno)
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        return count % self.every == 0
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    레코드를 큐에 넣기만 하는 핸들러. 포맷과 출력은 백그라운드 리스너 스레드가 처리합니다.
+    큐가 가득 차면 요청 스레드를 막지 않고 레코드를 버립니다.
     """
+
+    def prepare(self, record):
+        # 메시지 인자만 미리 합치고, 포맷(시간, 색상, 예외 추적)은 리스너 스레드에서 수행
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED_TOTAL.inc()
+
+
+def parse_log_levels(value):
+    """'app.db=INFO,urllib3=WARNING' 형식의 문자열을 {로거 이름: 레벨} dict로 변환하는 함수."""
+    levels = {}
+    for item in (value or '').split(','):
+        if '=' not in item:
+            continue
+        name, level = item.split('=', 1)
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def _create_handlers():
+    """콘솔 핸들러와 파일 핸들러를 생성하는 함수."""
     # 콘솔 핸들러 생성
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)  # DEBUG 레벨 이상을 로깅
-    color_formatter = ColoredFormatter()
-    console_handler.setFormatter(color_formatter)
+    console_handler.setFormatter(ColoredFormatter())
 
     # 파일 핸들러 생성
     log_file_path = os.path.join(os.path.dirname(__file__), '..', '..', 'app.log')
     file_handler = logging.FileHandler(log_file_path)
     file_handler.setLevel(logging.WARNING)  # 파일에 저장할 로그 레벨 설정
-    file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(file_formatter)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    return [console_handler, file_handler]
+
+
+def _start_listener(handlers):
+    """새 로그 큐와 리스너 스레드를 시작하고 큐 핸들러를 반환하는 함수."""
+    global _listener, _queue_handler
+    log_queue = queue.Queue(maxsize=Config.LOG_QUEUE_SIZE)
+    if _queue_handler is None:
+        _queue_handler = NonBlockingQueueHandler(log_queue)
+    else:
+        _queue_handler.queue = log_queue
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _queue_handler
+
+
+def _restart_listener_after_fork():
+    """
+    fork된 자식 프로세스에서 리스너를 다시 시작하는 함수.
+    pre-fork 서버(gunicorn preload_app)에서는 마스터의 리스너 스레드가 워커로 복제되지 않으므로,
+    새 큐와 리스너를 만들지 않으면 워커의 로그가 출력되지 않습니다.
+    """
+    global _listener
+    if _listener is None:
+        return
+    handlers = _listener.handlers
+    _listener = None
+    _start_listener(handlers)
+
+
+def _configure_root():
+    """기본 로거에 핸들러와 레벨을 설정하는 함수. 프로세스당 한 번만 호출됩니다."""
 
-    # 기본 로거 설정
     logger = logging.getLogger()
-    
+
     # 기존 핸들러가 있으면 제거
     if logger.hasHandlers():
         logger.handlers.clear()
-    
-    # 콘솔 및 파일 핸들러 추가
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.setLevel(logging.DEBUG)
 
-    return logger
+    handlers = _create_handlers()
+    if Config.LOG_ASYNC:
+        # 요청/수집 스레드는 큐에 넣기만 하고, 리스너 스레드가 포맷과 I/O를 처리
+        queue_handler = _start_listener(handlers)
+        atexit.register(stop_logging)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_restart_listener_after_fork)
+        handlers = [queue_handler]
+
+    for handler in handlers:
+        handler.addFilter(DebugSamplingFilter(Config.LOG_DEBUG_SAMPLE_EVERY))
+        logger.addHandler(handler)
+    logger.setLevel(Config.LOG_LEVEL)
+
+    # 로거별 레벨 설정
+    for name, level in parse_log_levels(Config.LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+
+def setup_logging(name=None):
+    """
+    로깅 설정을 구성하고 로거를 반환하는 함수.
+    콘솔에 컬러 로그를 출력하도록 설정하고, 파일에 로그를 기록합니다.
+    설정은 최초 호출 시 한 번만 적용되며, 이후 호출은 로거만 반환합니다.
+
+    Args:
+        name (str, optional): 로거 이름. 모듈에서는 __name__을 넘겨 LOG_LEVELS로 개별 레벨을 조정할 수 있습니다.
+
+    Returns:
+        Logger: 요청한 이름의 로거 (이름이 없으면 기본 로거).
+    """
+    global _configured
+    if not _configured:
+        with _setup_lock:
+            if not _configured:
+                _configure_root()
+                _configured = True
+    return logging.getLogger(name)
+
+
+def stop_logging():
+    """백그라운드 리스너를 중지하고 큐에 남은 레코드를 모두 출력하는 함수."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
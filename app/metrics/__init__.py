@@ -0,0 +1,8 @@
+from .metrics import (
+    Counter, Histogram, CallbackGauge, render_metrics,
+    enable_multiprocess, flush_metrics,
+    REQUEST_DURATION_SECONDS, REQUEST_STAGE_SECONDS,
+    DB_CONNECTIONS_TOTAL, CACHE_REQUESTS_TOTAL,
+    UPSTREAM_REQUESTS_TOTAL, UPSTREAM_REQUEST_SECONDS, PLACES_INDEX_REFRESH_SECONDS,
+    COLLECTOR_STAGE_SECONDS, COLLECTOR_RUN_SECONDS,
+)
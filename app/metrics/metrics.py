@@ -0,0 +1,464 @@
+import atexit
+import bisect
+import contextlib
+import glob
+import json
+import math
+import os
+import threading
+import time
+from ..config.config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# 등록된 모든 지표 (Prometheus 텍스트 형식으로 내보낼 순서대로)
+REGISTRY = []
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    """라벨 값의 역슬래시, 줄바꿈, 큰따옴표를 이스케이프하는 함수."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labelnames, values, extra=None):
+    """라벨 이름과 값을 Prometheus 라벨 문자열({a="1",b="2"})로 변환하는 함수."""
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    """지표 값을 Prometheus 텍스트 형식의 숫자로 변환하는 함수."""
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Timer:
+    """with 블록의 실행 시간을 히스토그램에 기록하는 컨텍스트 매니저."""
+
+    __slots__ = ('_histogram', '_key', '_start')
+
+    def __init__(self, histogram, key):
+        self._histogram = histogram
+        self._key = key
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram._observe(self._key, time.perf_counter() - self._start)
+        return False
+
+
+class Counter:
+    """단조 증가하는 카운터 지표."""
+
+    type_name = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, amount=1, **labels):
+        """카운터를 amount만큼 증가시키는 함수."""
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self):
+        """현재 값을 {라벨 값 튜플: 값} 형태로 반환하는 함수."""
+        with self._lock:
+            return dict(self._values)
+
+    def dump(self, values=None):
+        """프로세스 간 합산을 위해 현재 값(또는 merge 결과 values)을 JSON으로 저장할 수 있는 형태로 반환하는 함수."""
+        values = self.snapshot() if values is None else values
+        return [[list(key), value] for key, value in values.items()]
+
+    @staticmethod
+    def merge(dumps):
+        """여러 프로세스의 dump 결과를 라벨별로 합산하는 함수."""
+        values = {}
+        for dump in dumps:
+            for key, value in dump:
+                key = tuple(key)
+                values[key] = values.get(key, 0) + value
+        return values
+
+    def reset(self):
+        """값을 모두 지우는 함수 (fork된 자식 프로세스가 부모의 값을 중복 집계하지 않도록 사용)."""
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def render(self, values=None):
+        values = self.snapshot() if values is None else values
+        for key, value in values.items():
+            yield f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+
+
+class Histogram:
+    """구간별 관측 횟수와 합계를 기록하는 히스토그램 지표."""
+
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}  # 라벨 값 튜플 -> [구간별 횟수 리스트, 합계, 전체 횟수]
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _observe(self, key, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def observe(self, value, **labels):
+        """관측값 하나를 기록하는 함수."""
+        self._observe(tuple(labels[name] for name in self.labelnames), value)
+
+    def time(self, **labels):
+        """with 블록의 실행 시간(초)을 기록하는 컨텍스트 매니저를 반환하는 함수."""
+        return _Timer(self, tuple(labels[name] for name in self.labelnames))
+
+    def totals(self):
+        """라벨별 (합계, 횟수)를 {라벨 값 튜플: (합계, 횟수)} 형태로 반환하는 함수."""
+        with self._lock:
+            return {key: (state[1], state[2]) for key, state in self._values.items()}
+
+    def dump(self, values=None):
+        """프로세스 간 합산을 위해 현재 값(또는 merge 결과 values)을 JSON으로 저장할 수 있는 형태로 반환하는 함수."""
+        if values is None:
+            with self._lock:
+                return [[list(key), list(state[0]), state[1], state[2]] for key, state in self._values.items()]
+        return [[list(key), list(counts), total, count] for key, (counts, total, count) in values.items()]
+
+    @staticmethod
+    def merge(dumps):
+        """여러 프로세스의 dump 결과를 라벨별로 합산하는 함수."""
+        values = {}
+        for dump in dumps:
+            for key, counts, total, count in dump:
+                key = tuple(key)
+                state = values.get(key)
+                if state is None:
+                    values[key] = (list(counts), total, count)
+                else:
+                    values[key] = ([a + b for a, b in zip(state[0], counts)], state[1] + total, state[2] + count)
+        return values
+
+    def reset(self):
+        """값을 모두 지우는 함수 (fork된 자식 프로세스가 부모의 값을 중복 집계하지 않도록 사용)."""
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def render(self, values=None):
+        if values is None:
+            with self._lock:
+                values = {key: (list(state[0]), state[1], state[2]) for key, state in self._values.items()}
+        for key, (counts, total, count) in values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, ('le', _format_value(bound)))
+                yield f'{self.name}_bucket{labels} {cumulative}'
+            labels = _format_labels(self.labelnames, key)
+            yield f'{self.name}_sum{labels} {_format_value(total)}'
+            yield f'{self.name}_count{labels} {count}'
+
+
+class CallbackGauge:
+    """
+    스크레이프 시점에 콜백을 호출하여 값을 구하는 게이지 지표.
+    콜백은 {라벨 값 튜플: 값} 형태의 dict를 반환합니다.
+    """
+
+    type_name = 'gauge'
+
+    def __init__(self, name, documentation, callback, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        REGISTRY.append(self)
+
+    def render(self):
+        for key, value in self.callback().items():
+            if value is None:
+                continue
+            yield f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+
+
+class _MultiprocessStore:
+    """
+    pre-fork 서버의 워커마다 다른 카운터/히스토그램 값을 합산하기 위한 디렉터리 저장소.
+
+    각 프로세스는 자신의 값을 주기적으로(그리고 종료 시) 디렉터리의 <pid>.json에 기록하고,
+    스크레이프를 받은 프로세스는 모든 파일을 읽어 라벨별로 합산합니다. 디렉터리는 서버(마스터)를 시작할 때 비워야 합니다.
+
+    워커가 교체되어도 카운터가 줄어들지 않도록 종료된 워커의 값은 남겨 두되, 주기적으로(compact_seconds)
+    종료된 프로세스의 파일을 compacted.json 하나로 합쳐 파일이 계속 늘어나지 않게 합니다. 종료된 워커의 pid를
+    새 워커가 다시 받으면, 새 워커는 처음 기록할 때 이전 파일을 덮어쓰지 않고 archived-<pid>-<시각>.json으로 옮깁니다.
+    합치기와 옮기기는 디렉터리 잠금(.lock)을 배타적으로 잡고, 읽기는 공유 잠금을 잡아 중간 상태를 보지 않습니다.
+    """
+
+    COMPACTED = 'compacted.json'
+
+    def __init__(self, directory, flush_seconds, compact_seconds=60):
+        self.directory = directory
+        self.flush_seconds = flush_seconds
+        self.compact_seconds = compact_seconds
+        self._flusher_pid = None
+        self._flushed_pid = None
+        self._flusher_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+
+    def path(self, pid=None):
+        return os.path.join(self.directory, f'{pid or os.getpid()}.json')
+
+    @contextlib.contextmanager
+    def _directory_lock(self, exclusive, blocking=True):
+        # fcntl이 없는 환경(Windows)에서는 합치기를 하지 않으므로 잠금 없이 진행
+        if fcntl is None:
+            yield not exclusive
+            return
+        # 잠금을 잡은 채로 fork되면 자식이 잠금 파일 설명자를 물려받으므로, fork 전후(before_fork)와 함께 직렬화
+        with self._io_lock:
+            fd = os.open(os.path.join(self.directory, '.lock'), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                flags = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+                try:
+                    fcntl.flock(fd, flags if blocking else flags | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    yield False
+                    return
+                yield True
+            finally:
+                os.close(fd)
+
+    def _write(self, path, data):
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def flush(self):
+        """현재 프로세스의 카운터/히스토그램 값을 파일에 기록하는 함수."""
+        data = {metric.name: metric.dump() for metric in REGISTRY if hasattr(metric, 'dump')}
+        path = self.path()
+        if self._flushed_pid != os.getpid():
+            # 같은 pid를 쓰던 종료된 워커의 파일이 남아 있으면 덮어쓰지 않고 보존
+            with self._directory_lock(exclusive=True):
+                if os.path.exists(path):
+                    os.replace(path, os.path.join(self.directory, f'archived-{os.getpid()}-{time.time_ns()}.json'))
+            self._flushed_pid = os.getpid()
+        self._write(path, data)
+
+    def _read_all(self):
+        files = {}
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    files[path] = json.load(f)
+            except (OSError, ValueError):
+                continue
+        return files
+
+    def collect(self):
+        """모든 프로세스의 파일을 읽어 {지표 이름: [dump, ...]}로 반환하는 함수."""
+        with self._directory_lock(exclusive=False):
+            files = self._read_all()
+        dumps = {}
+        for data in files.values():
+            for name, dump in data.items():
+                dumps.setdefault(name, []).append(dump)
+        return dumps
+
+    def _is_dead(self, path):
+        name = os.path.basename(path)
+        if name == self.COMPACTED:
+            return False
+        if name.startswith('archived-'):
+            return True
+        try:
+            pid = int(name[:-len('.json')])
+        except ValueError:
+            return False
+        if pid == os.getpid():
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # 권한이 없는 경우 등은 살아 있는 것으로 간주
+            return False
+        return False
+
+    def compact(self):
+        """종료된 프로세스의 파일을 compacted.json에 합치고 삭제하는 함수. 다른 프로세스가 합치는 중이면 건너뜁니다."""
+        with self._directory_lock(exclusive=True, blocking=False) as locked:
+            if not locked:
+                return
+            files = self._read_all()
+            dead = [path for path in files if self._is_dead(path)]
+            if not dead:
+                return
+            compacted_path = os.path.join(self.directory, self.COMPACTED)
+            sources = [files[path] for path in dead]
+            if compacted_path in files:
+                sources.append(files[compacted_path])
+            compacted = {}
+            for metric in REGISTRY:
+                if hasattr(metric, 'merge'):
+                    dumps = [data[metric.name] for data in sources if metric.name in data]
+                    compacted[metric.name] = metric.dump(metric.merge(dumps))
+            self._write(compacted_path, compacted)
+            for path in dead:
+                os.remove(path)
+
+    def ensure_flusher(self):
+        # fork된 워커에는 마스터의 스레드가 없으므로 프로세스마다 시작
+        if self._flusher_pid == os.getpid():
+            return
+        with self._flusher_lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+            threading.Thread(target=self._flush_loop, name='metrics-flusher', daemon=True).start()
+
+    def _flush_loop(self):
+        compacted_at = time.monotonic()
+        while True:
+            time.sleep(self.flush_seconds)
+            try:
+                self.flush()
+                if time.monotonic() - compacted_at >= self.compact_seconds:
+                    compacted_at = time.monotonic()
+                    self.compact()
+            except OSError:
+                pass
+
+    def before_fork(self):
+        flush_metrics()
+        self._io_lock.acquire()
+
+    def after_fork_in_parent(self):
+        self._io_lock.release()
+
+    def after_fork_in_child(self):
+        # 부모(마스터)의 값은 부모 파일에 이미 기록되어 있으므로 자식은 0부터 집계
+        for metric in REGISTRY:
+            if hasattr(metric, 'reset'):
+                metric.reset()
+        self._io_lock = threading.Lock()
+        self._flusher_lock = threading.Lock()
+        self._flusher_pid = None
+        self.ensure_flusher()
+
+
+_store = None
+
+
+def enable_multiprocess(directory, flush_seconds=5):
+    """
+    여러 워커 프로세스의 지표를 directory를 통해 합산하도록 설정하는 함수.
+    설정하지 않으면 /metrics는 스크레이프를 받은 프로세스의 값만 반환합니다.
+    """
+    global _store
+    if _store is not None:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _store = _MultiprocessStore(directory, flush_seconds)
+    _store.ensure_flusher()
+    atexit.register(flush_metrics)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(
+            before=_store.before_fork,
+            after_in_parent=_store.after_fork_in_parent,
+            after_in_child=_store.after_fork_in_child,
+        )
+
+
+def flush_metrics():
+    """다중 프로세스 모드에서 현재 프로세스의 지표를 즉시 파일에 기록하는 함수."""
+    if _store is None:
+        return
+    try:
+        _store.flush()
+    except OSError:
+        pass
+
+
+def render_metrics():
+    """등록된 모든 지표를 Prometheus 텍스트 형식(0.0.4)으로 반환하는 함수."""
+    dumps = None
+    if _store is not None:
+        _store.ensure_flusher()
+        flush_metrics()
+        dumps = _store.collect()
+
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f'# HELP {metric.name} {metric.documentation}')
+        lines.append(f'# TYPE {metric.name} {metric.type_name}')
+        if dumps is not None and hasattr(metric, 'merge'):
+            lines.extend(metric.render(metric.merge(dumps.get(metric.name, []))))
+        else:
+            lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+# 웹 요청 지표
+REQUEST_DURATION_SECONDS = Histogram(
+    'gayou_request_duration_seconds', 'HTTP request latency by endpoint.', ['endpoint', 'method', 'status'])
+REQUEST_STAGE_SECONDS = Histogram(
+    'gayou_request_stage_seconds', 'Latency of each processing stage inside an endpoint.', ['endpoint', 'stage'])
+
+# 데이터베이스 / 캐시 / 외부 API 지표
+DB_CONNECTIONS_TOTAL = Counter(
+    'gayou_db_connections_total', 'Database connections opened.', ['outcome'])
+CACHE_REQUESTS_TOTAL = Counter(
+    'gayou_cache_requests_total', 'Cache lookups by cache and result (hit or miss).', ['cache', 'result'])
+UPSTREAM_REQUESTS_TOTAL = Counter(
+    'gayou_upstream_requests_total', 'Calls to upstream APIs by outcome.', ['api', 'outcome'])
+UPSTREAM_REQUEST_SECONDS = Histogram(
+    'gayou_upstream_request_seconds', 'Latency of upstream API calls.', ['api'])
+PLACES_INDEX_REFRESH_SECONDS = Histogram(
+    'gayou_places_index_refresh_seconds', 'Duration of places index refreshes by kind (delta or full).', ['kind'])
+
+# 데이터 수집 지표 (수집 작업이 실행된 프로세스 기준)
+COLLECTOR_STAGE_SECONDS = Histogram(
+    'gayou_collector_stage_seconds', 'Latency of each collector stage per chunk.', ['stage'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0))
+COLLECTOR_RUN_SECONDS = Histogram(
+    'gayou_collector_run_duration_seconds', 'Duration of whole collector runs.', ['status'],
+    buckets=(1.0, 10.0, 60.0, 300.0, 600.0, 1800.0, 3600.0, 7200.0, 14400.0))
+
+# pre-fork 서버에서 워커들의 값을 합산 (gunicorn.conf.py가 METRICS_DIR을 설정)
+if Config.METRICS_DIR:
+    enable_multiprocess(Config.METRICS_DIR, Config.METRICS_FLUSH_SECONDS)
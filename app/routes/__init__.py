@@ -1,6 +1,13 @@
 from .places_routes import places_bp
+from .metrics_routes import metrics_bp, init_request_metrics
+from .health_routes import health_bp
+from .http_cache import init_compression
 
 def init_routes(app):
     """애플리케이션에 라우트를 등록하는 함수."""
+    init_request_metrics(app)
+    init_compression(app)
     app.register_blueprint(places_bp, url_prefix='/route/locations')
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(health_bp, url_prefix='/health')
     # 다른 블루프린트도 여기에 등록합니다.
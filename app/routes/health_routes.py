@@ -0,0 +1,18 @@
+from flask import Blueprint, jsonify
+from ..index import is_ready
+
+health_bp = Blueprint('health', __name__)
+
+
+@health_bp.route('/live', methods=['GET'])
+def live():
+    """프로세스가 살아 있으면 항상 200을 반환하는 liveness 엔드포인트."""
+    return jsonify({"status": "alive"}), 200
+
+
+@health_bp.route('/ready', methods=['GET'])
+def ready():
+    """places 스냅샷과 색인이 준비되었을 때만 200을 반환하는 readiness 엔드포인트."""
+    if not is_ready():
+        return jsonify({"status": "warming up"}), 503
+    return jsonify({"status": "ready"}), 200
@@ -0,0 +1,124 @@
+import gzip
+import hashlib
+from functools import wraps
+from urllib.parse import urlencode
+from flask import g, make_response, request
+from ..config.config import Config
+from ..index import get_places_snapshot
+from ..metrics import CACHE_REQUESTS_TOTAL
+
+# gzip으로 압축된 표현의 ETag 접미어 (압축 여부에 따라 표현이 다르므로 강한 ETag도 달라야 함)
+GZIP_ETAG_SUFFIX = '-gzip'
+
+
+def normalized_query(args):
+    """
+    쿼리 파라미터를 정규화한 문자열을 반환하는 함수.
+    키 순서와 다중 값(neighborhoods[], selectedConcepts[])의 순서는 결과에 영향을 주지 않으므로 정렬합니다.
+    값은 URL 인코딩하여 'a,b' 하나와 'a', 'b' 두 값이 같은 문자열이 되지 않게 합니다.
+    """
+    return urlencode(sorted((key, value) for key, values in args.lists() for value in values))
+
+
+def current_snapshot():
+    """
+    요청에서 사용할 places 스냅샷을 반환하는 함수.
+    conditional_get이 ETag를 만들 때 사용한 스냅샷을 그대로 사용하여, 그 사이에 스냅샷이 교체되어도
+    응답 본문과 ETag의 데이터셋 버전이 일치하도록 합니다.
+    """
+    snapshot = g.get('places_snapshot')
+    if snapshot is None:
+        snapshot = g.places_snapshot = get_places_snapshot()
+    return snapshot
+
+
+def make_etag(version, path, args):
+    """데이터셋 버전, 경로, 정규화된 쿼리 파라미터로 강한 ETag 값을 만드는 함수."""
+    digest = hashlib.sha1(f"{version}|{path}|{normalized_query(args)}".encode('utf-8')).hexdigest()
+    return digest[:32]
+
+
+def _set_cache_headers(response, etag):
+    """ETag와 CDN 캐시에 적합한 Cache-Control, Vary 헤더를 설정하는 함수."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = (
+        f"public, max-age={Config.PLACES_CACHE_MAX_AGE}, s-maxage={Config.PLACES_CACHE_S_MAXAGE}"
+    )
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def _matching_etag(etag):
+    """
+    If-None-Match와 일치하는 ETag(압축 표현이면 접미어 포함)를 반환하는 함수. 일치하지 않으면 None.
+    304 응답은 캐시가 저장한 표현을 갱신할 수 있도록 200 응답이 보냈을 것과 같은 ETag를 담아야 합니다.
+    """
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return etag
+    gzip_etag = etag + GZIP_ETAG_SUFFIX
+    candidates = (gzip_etag, etag) if 'gzip' in request.accept_encodings else (etag, gzip_etag)
+    for candidate in candidates:
+        if if_none_match.contains(candidate):
+            return candidate
+    return None
+
+
+def conditional_get(view):
+    """
+    데이터셋 버전 기반 ETag로 조건부 GET을 처리하는 데코레이터.
+    If-None-Match가 현재 ETag(압축 여부 무관)와 같으면 뷰를 실행하지 않고 304를 반환합니다.
+    데이터는 수집 작업이 실행될 때만 바뀌므로, 같은 버전과 같은 파라미터의 응답은 항상 같습니다.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        try:
+            snapshot = current_snapshot()
+        except Exception:
+            # 스냅샷을 불러올 수 없으면 캐시 처리 없이 뷰가 오류 응답을 만들도록 함
+            return view(*args, **kwargs)
+        etag = make_etag(snapshot.version or snapshot.loaded_at, request.path, request.args)
+
+        matched = _matching_etag(etag)
+        if matched:
+            CACHE_REQUESTS_TOTAL.inc(cache='http_etag', result='hit')
+            return _set_cache_headers(make_response('', 304), matched)
+
+        CACHE_REQUESTS_TOTAL.inc(cache='http_etag', result='miss')
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            _set_cache_headers(response, etag)
+        return response
+
+    return wrapper
+
+
+def init_compression(app):
+    """
+    큰 JSON 응답을 gzip으로 압축하도록 훅을 등록하는 함수.
+    Config.COMPRESS_MIN_SIZE보다 작은 응답은 압축 이득보다 CPU 비용이 크므로 그대로 보냅니다.
+    """
+
+    @app.after_request
+    def _compress(response):
+        if (
+            response.status_code != 200
+            or response.direct_passthrough
+            or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.accept_encodings
+        ):
+            return response
+
+        data = response.get_data()
+        if len(data) < Config.COMPRESS_MIN_SIZE:
+            return response
+
+        response.set_data(gzip.compress(data, compresslevel=Config.COMPRESS_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(etag + GZIP_ETAG_SUFFIX, weak)
+        return response
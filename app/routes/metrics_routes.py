@@ -0,0 +1,76 @@
+import time
+from datetime import datetime
+from flask import Blueprint, Response, g, request
+from ..metrics import CallbackGauge, REQUEST_DURATION_SECONDS, render_metrics
+from ..scheduler.job_runner import read_job_status
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+def _collector_last_run():
+    """마지막 수집 작업의 소요 시간, 성공 여부, 종료 시각, 저장/저장 실패 행 수를 게이지 값으로 변환하는 함수."""
+    status = read_job_status()
+    if not status.get('finished_at'):
+        return {}
+    finished_at = datetime.fromisoformat(status['finished_at']).timestamp()
+    summary = status.get('summary') or {}
+    return {
+        ('duration_seconds',): status.get('duration_seconds'),
+        ('success',): 1 if status.get('status') == 'success' else 0,
+        ('finished_timestamp_seconds',): finished_at,
+        ('rows',): summary.get('rows', 0),
+        ('failed_rows',): summary.get('failed_rows', 0),
+    }
+
+
+def _collector_last_run_stages():
+    """마지막 수집 작업의 단계별 소요 시간 합계를 게이지 값으로 변환하는 함수."""
+    summary = read_job_status().get('summary') or {}
+    return {(stage,): seconds for stage, seconds in summary.get('stage_seconds', {}).items()}
+
+
+def _collector_last_run_upstream_calls():
+    """마지막 수집 작업의 외부 API 호출 횟수를 게이지 값으로 변환하는 함수."""
+    summary = read_job_status().get('summary') or {}
+    return {
+        tuple(key.split(':', 1)): count
+        for key, count in summary.get('upstream_calls', {}).items()
+    }
+
+
+# 수집 작업은 별도 프로세스에서 실행될 수 있으므로 상태 파일을 스크레이프 시점에 읽어서 노출
+CallbackGauge(
+    'gayou_collector_last_run', 'Last collector run (duration_seconds, success, finished_timestamp_seconds, rows, failed_rows).',
+    _collector_last_run, ['field'])
+CallbackGauge(
+    'gayou_collector_last_run_stage_seconds', 'Total seconds spent per stage in the last collector run.',
+    _collector_last_run_stages, ['stage'])
+CallbackGauge(
+    'gayou_collector_last_run_upstream_calls', 'Upstream API calls made by the last collector run.',
+    _collector_last_run_upstream_calls, ['api', 'outcome'])
+
+
+def init_request_metrics(app):
+    """모든 요청의 처리 시간을 엔드포인트별로 기록하도록 훅을 등록하는 함수."""
+
+    @app.before_request
+    def _start_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _record_duration(response):
+        started = g.pop('request_started', None)
+        if started is not None:
+            REQUEST_DURATION_SECONDS.observe(
+                time.perf_counter() - started,
+                endpoint=request.endpoint or 'unknown',
+                method=request.method,
+                status=response.status_code,
+            )
+        return response
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus 텍스트 형식으로 지표를 반환하는 엔드포인트."""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4; charset=utf-8')
@@ -1,28 +1,53 @@
 from flask import Blueprint, request, jsonify
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import pandas as pd
-from ..db import execute_query
-from ..db.queries import SELECT_ALL_PLACES
+from ..index import DETAIL_COLUMNS, FACET_DIMENSIONS, fetch_place_details
+from .http_cache import conditional_get, current_snapshot
 from ..logging import setup_logging
+from ..metrics import REQUEST_STAGE_SECONDS
 
-logger = setup_logging()
+logger = setup_logging(__name__)
 places_bp = Blueprint('route/locations', __name__)
 
 
-def fetch_places(limit=None):
-    """Fetches places from the database with an optional limit."""
-    try:
-        query = SELECT_ALL_PLACES
-        if limit:
-            query += f" LIMIT {limit}"
-        places = execute_query(query)
-        if places is None:
-            raise ValueError("Failed to fetch places from the database.")
-        return places
-    except Exception as e:
-        logger.error(f"Error fetching places: {e}")
-        raise
+# 목록 화면에 필요한 기본 필드 (제목, 이미지, 주소, 좌표)
+DEFAULT_FIELDS = ['contentid', 'title', 'firstimage', 'addr1', 'addr2', 'mapx', 'mapy']
+
+# fields 파라미터로 요청할 수 있는 필드 (combined_text는 내부용이므로 제외)
+ALLOWED_FIELDS = [
+    'contentid', 'title', 'addr1', 'addr2', 'cat1', 'cat2', 'cat3', 'contenttypeid', 'sigungucode',
+    'overview', 'overview_summary', 'firstimage', 'firstimage2', 'mapx', 'mapy', 'zipcode', 'similarity'
+]
+
+
+def parse_fields(value) -> list:
+    """Parses the comma separated `fields` parameter. Missing means DEFAULT_FIELDS, 'all' means ALLOWED_FIELDS."""
+    if not value:
+        return DEFAULT_FIELDS
+    if value == 'all':
+        return ALLOWED_FIELDS
+    fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in ALLOWED_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def build_records(df: pd.DataFrame, fields: list) -> list:
+    """Serializes only the requested fields, loading long text columns from the database for these rows only."""
+    records = df[[field for field in fields if field in df.columns]].to_dict(orient='records')
+
+    detail_fields = [field for field in fields if field in DETAIL_COLUMNS]
+    if detail_fields and records:
+        details = fetch_place_details(df['contentid'].tolist(), detail_fields)
+        for record, content_id in zip(records, df['contentid']):
+            record.update(details.get(int(content_id), {}))
+
+    return [{field: record.get(field) for field in fields} for record in records]
+
+
+def stage_timer(stage):
+    """현재 요청 엔드포인트의 처리 단계 소요 시간을 기록하는 컨텍스트 매니저를 반환하는 함수."""
+    return REQUEST_STAGE_SECONDS.time(endpoint=request.endpoint, stage=stage)
 
 
 def filter_data_by_preference(df: pd.DataFrame, preference: dict) -> pd.DataFrame:
@@ -47,42 +72,41 @@ def filter_data_by_preference(df: pd.DataFrame, preference: dict) -> pd.DataFram
     ].copy()
 
 
-def calculate_cosine_similarity(filtered_df: pd.DataFrame, preference: dict) -> pd.DataFrame:
-    """Calculates cosine similarity based on user-selected concepts."""
-    filtered_df = filtered_df[filtered_df['combined_text'].str.strip() != '']
+def calculate_cosine_similarity(filtered_df: pd.DataFrame, preference: dict, snapshot) -> pd.DataFrame:
+    """Calculates cosine similarity based on user-selected concepts using the snapshot's TF-IDF index."""
+    filtered_df = filtered_df[snapshot.has_text[filtered_df.index.to_numpy()]]
 
     if filtered_df.empty:
         logger.info("No valid combined_text. Recommending based on full data.")
         return pd.DataFrame()
 
     user_input = ' '.join(preference.get("selectedConcepts", []))
-    vectorizer = TfidfVectorizer(stop_words=None)
-    tfidf_matrix = vectorizer.fit_transform(filtered_df['combined_text'])
-
-    user_vector = vectorizer.transform([user_input])
-    cosine_similarities = cosine_similarity(user_vector, tfidf_matrix).flatten()
+    with stage_timer('tfidf'):
+        cosine_similarities = snapshot.similarity(filtered_df.index.to_numpy(), user_input)
 
-    filtered_df['similarity'] = cosine_similarities
-    return filtered_df.sort_values(by='similarity', ascending=False)
+    with stage_timer('sort'):
+        filtered_df['similarity'] = cosine_similarities
+        return filtered_df.sort_values(by='similarity', ascending=False)
 
 
-def create_course(filtered_df: pd.DataFrame, retry) -> list:
+def create_course(filtered_df: pd.DataFrame, retry) -> pd.DataFrame:
     """Creates a travel course based on the highest similarity scores."""
-    course = []
-
     restaurant_df = filtered_df[filtered_df['cat1'] == '음식']
     other_df = filtered_df[filtered_df['cat1'] != '음식']
 
-    course.append(other_df.iloc[(3 * retry) % len(other_df)].to_dict())
-    course.append(restaurant_df.iloc[(3 * retry) % len(restaurant_df)].to_dict())
-    course.append(other_df.iloc[(3 * retry + 1) % len(other_df)].to_dict())
-    course.append(restaurant_df.iloc[(3 * retry + 1) % len(restaurant_df)].to_dict())
-    course.append(other_df.iloc[(3 * retry + 2) % len(other_df)].to_dict())
+    course = [
+        other_df.iloc[[(3 * retry) % len(other_df)]],
+        restaurant_df.iloc[[(3 * retry) % len(restaurant_df)]],
+        other_df.iloc[[(3 * retry + 1) % len(other_df)]],
+        restaurant_df.iloc[[(3 * retry + 1) % len(restaurant_df)]],
+        other_df.iloc[[(3 * retry + 2) % len(other_df)]],
+    ]
 
-    return course
+    return pd.concat(course)
 
 
 @places_bp.route('/', methods=['GET'])
+@conditional_get
 def recommend():
     """Endpoint to recommend a course based on user preferences."""
     try:
@@ -90,6 +114,10 @@ def recommend():
         neighborhoods = request.args.getlist('neighborhoods[]')
         selected_concepts = request.args.getlist('selectedConcepts[]')
         retry = int(request.args.get('rec', None))
+        try:
+            fields = parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
         if neighborhoods == ['전체']:
             neighborhoods = []
@@ -100,35 +128,39 @@ def recommend():
             'selectedConcepts': selected_concepts
         }
         
-        places_data = fetch_places()
-        df = pd.DataFrame(places_data)
+        with stage_timer('fetch'):
+            snapshot = current_snapshot()
 
-        if df.empty:
+        if snapshot.size == 0:
             return jsonify({"error": "No data available"}), 500
 
-        filtered_df = filter_data_by_preference(df, preference)
+        with stage_timer('filter'):
+            filtered_df = snapshot.select(lambda df: filter_data_by_preference(df, preference))
         
         if filtered_df.empty:
             return jsonify({"error": "No matching places found based on preference"}), 404
 
-        recommended_df = calculate_cosine_similarity(filtered_df, preference)
+        recommended_df = calculate_cosine_similarity(filtered_df, preference, snapshot)
 
         if recommended_df.empty:
             return jsonify({"error": "No recommendations available"}), 404
 
-        recommended_course = create_course(recommended_df, retry)
+        with stage_timer('course'):
+            recommended_course = create_course(recommended_df, retry)
 
-        content = {
-            'town': region,
-            'data': recommended_course,
-        }
-        return jsonify(content), 200
+        with stage_timer('serialize'):
+            content = {
+                'town': region,
+                'data': build_records(recommended_course, fields),
+            }
+            return jsonify(content), 200
     except Exception as e:
         logger.error(f"Error during recommendation: {e}")
         return jsonify({"error": str(e)}), 500
 
 
 @places_bp.route('/sort/', methods=['GET'])
+@conditional_get
 def get_places_by_similarity():
     """Endpoint to sort places by similarity based on preferences."""
     try:
@@ -138,6 +170,10 @@ def get_places_by_similarity():
         region = request.args.get('region', None)
         neighborhoods = request.args.getlist('neighborhoods[]')
         selected_concepts = request.args.getlist('selectedConcepts[]')
+        try:
+            fields = parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         if neighborhoods == ['전체']:
             neighborhoods = []
 
@@ -147,42 +183,89 @@ def get_places_by_similarity():
             'selectedConcepts': selected_concepts
         }
         
-        places_data = fetch_places()
-        df = pd.DataFrame(places_data)
+        with stage_timer('fetch'):
+            snapshot = current_snapshot()
 
-        if df.empty:
+        if snapshot.size == 0:
             return jsonify({"error": "No data available"}), 500
 
-        filtered_df = filter_data_by_preference(df, preference)
+        with stage_timer('filter'):
+            filtered_df = snapshot.select(lambda df: filter_data_by_preference(df, preference))
 
         if filtered_df.empty:
             return jsonify({"error": "No matching places found based on preference"}), 404
 
         if query:
-            filtered_df = filtered_df[
-                filtered_df[['title', 'addr1', 'addr2']].apply(
-                    lambda row: row.astype(str).str.contains(query, case=False).any(), axis=1)
-            ]
+            with stage_timer('query'):
+                filtered_df = filtered_df[
+                    filtered_df[['title', 'addr1', 'addr2']].apply(
+                        lambda row: row.astype(str).str.contains(query, case=False).any(), axis=1)
+                ]
         
         if filtered_df.empty:
             recommended_df = pd.DataFrame()
         else:
-            recommended_df = calculate_cosine_similarity(filtered_df, preference)
+            recommended_df = calculate_cosine_similarity(filtered_df, preference, snapshot)
 
         total_items = len(recommended_df)
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
         paginated_df = recommended_df.iloc[start_idx:end_idx]
 
-        response_data = {
-            "page": page,
-            "page_size": page_size,
-            "total_items": total_items,
-            "total_pages": (total_items // page_size) + (1 if total_items % page_size != 0 else 0),
-            "data": paginated_df.to_dict(orient='records')
-        }
-        return jsonify(response_data), 200
+        with stage_timer('serialize'):
+            response_data = {
+                "page": page,
+                "page_size": page_size,
+                "total_items": total_items,
+                "total_pages": (total_items // page_size) + (1 if total_items % page_size != 0 else 0),
+                "data": build_records(paginated_df, fields)
+            }
+            return jsonify(response_data), 200
 
     except Exception as e:
         logger.error(f"Error during similarity query: {e}")
         return jsonify({"error": str(e)}), 500
+
+
+@places_bp.route('/suggest/', methods=['GET'])
+@conditional_get
+def suggest():
+    """Endpoint for typeahead suggestions over place titles, regions and neighborhoods."""
+    try:
+        query = request.args.get('q', '').strip()
+        try:
+            limit = min(max(int(request.args.get('limit', 10)), 1), 50)
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+
+        with stage_timer('fetch'):
+            snapshot = current_snapshot()
+        with stage_timer('suggest'):
+            suggestions = snapshot.suggest_index.suggest(query, limit) if query else []
+        return jsonify({"query": query, "suggestions": suggestions}), 200
+
+    except Exception as e:
+        logger.error(f"Error during suggestion lookup: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@places_bp.route('/facets/', methods=['GET'])
+@conditional_get
+def facets():
+    """Endpoint for per-value counts of cat1/cat2/contenttypeid/sigungucode under the given filters."""
+    try:
+        region = request.args.get('region', None)
+        neighborhoods = request.args.getlist('neighborhoods[]')
+        if neighborhoods == ['전체']:
+            neighborhoods = []
+        filters = {dimension: request.args.getlist(f'{dimension}[]') for dimension in FACET_DIMENSIONS}
+
+        with stage_timer('fetch'):
+            snapshot = current_snapshot()
+        with stage_timer('facets'):
+            result = snapshot.facet_index.counts(region, neighborhoods, filters)
+        return jsonify(result), 200
+
+    except Exception as e:
+        logger.error(f"Error during facet counting: {e}")
+        return jsonify({"error": str(e)}), 500
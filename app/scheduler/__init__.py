@@ -1,2 +1,15 @@
-from .scheduler_controller import start_scheduler, stop_scheduler, is_scheduler_running
-from .data_collector import collect_data
+# 스케줄러(APScheduler)와 수집 모듈(pandas, openai, openpyxl)은 무거우므로,
+# 웹 워커가 이 패키지의 가벼운 모듈(job_runner 등)만 불러올 때는 로드되지 않도록 지연 임포트합니다.
+_LAZY_ATTRIBUTES = {
+    'start_scheduler': '.scheduler_controller',
+    'stop_scheduler': '.scheduler_controller',
+    'is_scheduler_running': '.scheduler_controller',
+    'collect_data': '.data_collector',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,133 @@
+import os
+import pickle
+import threading
+import pandas as pd
+from ..config.config import Config
+from ..logging import setup_logging
+from ..metrics import CACHE_REQUESTS_TOTAL
+
+# 로그 설정
+logger = setup_logging(__name__)
+
+# 캐시 파일 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_FORMAT_VERSION = 2
+
+CLASSIFICATION_KEYS = ['cat1', 'cat2', 'cat3']
+CLASSIFICATION_NAMES = ['대분류', '중분류', '소분류']
+
+# 프로세스 내 캐시: (원본 파일 시그니처, 분류 테이블)
+_cache_lock = threading.Lock()
+_cached = None
+
+
+def _source_signature(xlsx_path):
+    """원본 엑셀 파일의 변경 여부를 판단하기 위한 시그니처(수정 시각, 크기)를 반환하는 함수."""
+    stat = os.stat(xlsx_path)
+    return CACHE_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size
+
+
+def _read_xlsx(xlsx_path):
+    """
+    서비스 분류코드 엑셀 파일을 읽어 (cat1, cat2, cat3) 인덱스를 가진 분류 테이블로 변환하는 함수.
+
+    Returns:
+        DataFrame: 대분류, 중분류, 소분류 이름을 담고 코드 3개를 MultiIndex로 가지는 데이터프레임.
+    """
+    classification_df = pd.read_excel(xlsx_path, header=4).iloc[:, 1:]
+    classification_df.columns = CLASSIFICATION_KEYS + CLASSIFICATION_NAMES
+    classification_df = classification_df.drop_duplicates(subset=CLASSIFICATION_KEYS)
+    return classification_df.set_index(CLASSIFICATION_KEYS)
+
+
+def _read_cache(cache_path, signature):
+    """
+    캐시 파일이 원본과 같은 시그니처를 가지면 분류 테이블을, 아니면 None을 반환하는 함수.
+    캐시를 읽거나 복원하지 못하면(손상, 다른 Python 버전으로 기록 등) 어떤 오류든 캐시가 없는 것으로 처리합니다.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if not isinstance(cached, dict) or cached.get('signature') != signature:
+            return None
+        table = pd.DataFrame(cached['rows'], columns=CLASSIFICATION_KEYS + CLASSIFICATION_NAMES)
+        return table.set_index(CLASSIFICATION_KEYS)
+    except Exception as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.warning(f"Ignoring unreadable classification cache: {e}")
+        return None
+
+
+def _write_cache(cache_path, signature, table):
+    """
+    분류 테이블을 캐시 파일로 저장하는 함수. 임시 파일에 쓴 뒤 교체하여 부분 기록을 방지합니다.
+    pandas 버전에 따라 DataFrame의 pickle 형식이 달라지므로 테이블은 Python 기본 타입의 행 목록으로 저장합니다.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    rows = [tuple(row) for row in table.reset_index().astype(object).itertuples(index=False)]
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'signature': signature, 'rows': rows}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to write classification cache: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_classification(xlsx_path=None, cache_path=None):
+    """
+    서비스 분류 테이블을 반환하는 함수.
+
+    엑셀 파일은 최초 한 번만 파싱하여 캐시 파일로 저장하고, 이후에는 캐시 파일을 읽습니다.
+    엑셀 파일의 수정 시각이나 크기가 바뀌면 캐시는 자동으로 무효화됩니다.
+
+    Args:
+        xlsx_path (str, optional): 서비스 분류코드 엑셀 파일 경로. 기본값은 Config.CLASSIFICATION_XLSX_PATH.
+        cache_path (str, optional): 캐시 파일 경로. 기본값은 Config.CLASSIFICATION_CACHE_PATH.
+
+    Returns:
+        DataFrame: (cat1, cat2, cat3) MultiIndex와 대분류, 중분류, 소분류 컬럼을 가진 데이터프레임.
+    """
+    global _cached
+    xlsx_path = xlsx_path or Config.CLASSIFICATION_XLSX_PATH
+    cache_path = cache_path or Config.CLASSIFICATION_CACHE_PATH
+    signature = _source_signature(xlsx_path)
+
+    with _cache_lock:
+        if _cached is not None and _cached[0] == (xlsx_path, signature):
+            CACHE_REQUESTS_TOTAL.inc(cache='classification', result='hit')
+            return _cached[1]
+
+        table = _read_cache(cache_path, signature)
+        if table is None:
+            CACHE_REQUESTS_TOTAL.inc(cache='classification', result='miss')
+            logger.info("Classification cache is missing or stale. Parsing xlsx file.")
+            table = _read_xlsx(xlsx_path)
+            _write_cache(cache_path, signature, table)
+        else:
+            CACHE_REQUESTS_TOTAL.inc(cache='classification', result='hit')
+
+        _cached = ((xlsx_path, signature), table)
+        return table
+
+
+def lookup_classification(df, classification=None):
+    """
+    데이터프레임의 cat1, cat2, cat3 코드를 분류 이름으로 변환한 컬럼들을 반환하는 함수.
+
+    병합(merge) 대신 MultiIndex 재색인으로 조회하므로 행 순서와 인덱스가 그대로 유지됩니다.
+
+    Args:
+        df (DataFrame): cat1, cat2, cat3 코드 컬럼을 포함한 데이터프레임.
+        classification (DataFrame, optional): load_classification()이 반환한 분류 테이블.
+
+    Returns:
+        DataFrame: df와 같은 인덱스를 가지며 cat1, cat2, cat3 이름 컬럼을 담은 데이터프레임.
+    """
+    if classification is None:
+        classification = load_classification()
+    keys = pd.MultiIndex.from_frame(df[CLASSIFICATION_KEYS].astype(object))
+    names = classification.reindex(keys)
+    names.index = df.index
+    names.columns = CLASSIFICATION_KEYS
+    return names
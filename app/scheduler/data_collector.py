@@ -1,37 +1,71 @@
+import logging
 import re
+import queue
+import threading
 import requests
 import pandas as pd
 import openai
 import re
 from ..db import save_to_db
+from .classification import load_classification, lookup_classification
 from ..config.config import Config
 from ..logging import setup_logging
+from ..metrics import (
+    UPSTREAM_REQUESTS_TOTAL, UPSTREAM_REQUEST_SECONDS, COLLECTOR_STAGE_SECONDS
+)
 
 # 로그 설정
-logger = setup_logging()
+logger = setup_logging(__name__)
 
 # OpenAI API 키 설정
 openai.api_key = Config.OPENAI_API_KEY
 
 # 정규 표현식 컴파일 (한 번만 컴파일)
-# 특수 문자를 제거하는 패턴과 다중 공백을 단일 공백으로 바꾸는 패턴을 미리 컴파일하여 성능을 향상
+# 특수 문자를 제거하는 패턴을 미리 컴파일하여 성능을 향상
 re_special_chars = re.compile(r'[^a-z0-9가-힣\s]')
-re_multiple_spaces = re.compile(r'\s+')
 
 
-def fetch_area_based_data(service_key, base_url):
+def request_upstream(api, url, params):
     """
-    지역 기반 데이터를 공공 API로부터 수집하는 함수.
-    
+    공공 API를 호출하고 호출 결과와 지연 시간을 지표로 기록하는 함수.
+
+    Args:
+        api (str): 지표에 기록할 API 이름.
+        url (str): 요청 URL.
+        params (dict): 요청 파라미터.
+
+    Returns:
+        Response: HTTP 에러가 없는 응답 객체. 실패하면 requests.RequestException을 발생시킴.
+    """
+    with UPSTREAM_REQUEST_SECONDS.time(api=api):
+        try:
+            response = requests.get(url, params=params)
+            response.raise_for_status()  # HTTP 에러 발생 시 예외 처리
+        except requests.RequestException:
+            UPSTREAM_REQUESTS_TOTAL.inc(api=api, outcome='error')
+            raise
+    UPSTREAM_REQUESTS_TOTAL.inc(api=api, outcome='ok')
+    return response
+
+
+def iter_area_based_items(service_key, base_url, chunk_size=None):
+    """
+    지역 기반 데이터를 공공 API로부터 페이지 단위로 수집하여 청크 단위로 내보내는 제너레이터.
+
+    전체 목록을 메모리에 모으지 않고, chunk_size 개의 항목이 모일 때마다 바로 내보냅니다.
+
     Args:
         service_key (str): 공공데이터 API 서비스 키.
         base_url (str): API의 기본 URL.
-    
-    Returns:
-        DataFrame: 수집된 데이터를 포함하는 판다스 데이터프레임.
+        chunk_size (int, optional): 한 번에 내보낼 항목 수. 기본값은 Config.COLLECT_CHUNK_SIZE.
+
+    Yields:
+        list: 최대 chunk_size 개의 항목(dict)을 담은 리스트.
     """
+    chunk_size = chunk_size or Config.COLLECT_CHUNK_SIZE
     logger.info("Starting area-based data collection process.")
-    all_items = []  # 모든 데이터를 저장할 리스트
+    buffer = []  # 아직 내보내지 않은 항목
+    collected = 0  # 지금까지 수집한 항목 수
     page_no = 1  # 첫 페이지부터 시작
 
     while True:
@@ -50,14 +84,15 @@ def fetch_area_based_data(service_key, base_url):
 
         try:
             # API 요청
-            response = requests.get(f"{base_url}/areaBasedList1", params=params)
-            response.raise_for_status()  # HTTP 에러 발생 시 예외 처리
+            response = request_upstream('areaBasedList1', f"{base_url}/areaBasedList1", params)
         except requests.RequestException as e:
             logger.error(f"Failed to fetch data from areaBasedList1 API: {e}")
             break
 
         logger.info(f"Response status code: {response.status_code}")
-        logger.debug(f"Response text: {response.text}")
+        # 응답 전체(최대 수 MB)를 문자열로 만들지 않도록 DEBUG가 켜진 경우에만 앞부분만 기록
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Response text ({len(response.text)} chars): {response.text[:500]}")
 
         # 응답이 비어있는지 확인
         if not response.text.strip():
@@ -75,26 +110,48 @@ def fetch_area_based_data(service_key, base_url):
         items = data_dict.get('response', {}).get('body', {}).get('items', {}).get('item')
 
         if items:
-            # 리스트 형식으로 데이터를 저장
-            if isinstance(items, list):
-                all_items.extend(items)
-            else:
-                all_items.append(items)
+            if not isinstance(items, list):
+                items = [items]
+            buffer.extend(items)
+            collected += len(items)
+
+            # 청크 크기만큼 모이면 바로 내보냄
+            while len(buffer) >= chunk_size:
+                yield buffer[:chunk_size]
+                buffer = buffer[chunk_size:]
 
             total_count = int(data_dict['response']['body']['totalCount'])
-            logger.info(f"Collected {len(all_items)} of {total_count} items so far.")
+            logger.info(f"Collected {collected} of {total_count} items so far.")
 
             # 수집된 데이터가 전체 개수에 도달하면 종료
-            if len(all_items) >= total_count:
+            if collected >= total_count:
                 logger.info("Collected all data from areaBasedList1 API.")
                 break
             page_no += 1
         else:
             logger.warning("No more data available or response format changed.")
             break
-        
-    if not all_items:
+
+    if buffer:
+        yield buffer
+
+    if not collected:
         logger.warning("No data collected from areaBasedList1 API.")
+
+
+def fetch_area_based_data(service_key, base_url):
+    """
+    지역 기반 데이터를 공공 API로부터 수집하는 함수.
+    
+    Args:
+        service_key (str): 공공데이터 API 서비스 키.
+        base_url (str): API의 기본 URL.
+    
+    Returns:
+        DataFrame: 수집된 데이터를 포함하는 판다스 데이터프레임.
+    """
+    all_items = [item for chunk in iter_area_based_items(service_key, base_url) for item in chunk]
+    if not all_items:
         return pd.DataFrame()  # 빈 데이터프레임 반환
 
     return pd.DataFrame(all_items)
@@ -117,7 +174,7 @@ def fetch_additional_overview(service_key, base_url, df):
 
     # 수집된 데이터프레임에서 contentid를 순차적으로 처리
     for content_id in df['contentid'].unique():
-        logger.info(f"Fetching overview for content ID {content_id} from detailCommon1 API.")
+        logger.debug(f"Fetching overview for content ID {content_id} from detailCommon1 API.")
         params = {
             'serviceKey': service_key,
             'contentId': content_id,
@@ -129,8 +186,7 @@ def fetch_additional_overview(service_key, base_url, df):
 
         try:
             # API 요청
-            response = requests.get(f"{base_url}/detailCommon1", params=params)
-            response.raise_for_status()  # HTTP 에러 발생 시 예외 처리
+            response = request_upstream('detailCommon1', f"{base_url}/detailCommon1", params)
 
             if response.status_code != 200:
                 logger.error(f"Failed to fetch overview for content ID {content_id}. Status code: {response.status_code}")
@@ -166,12 +222,83 @@ def fetch_additional_overview(service_key, base_url, df):
     return pd.DataFrame(data_list)
 
 
-def preprocess_data(df):
+def normalize_text(series):
+    """
+    텍스트 시리즈를 정규화하는 함수. 소문자로 변환하고 특수 문자를 제거한 뒤 다중 공백을 단일 공백으로 바꿈.
+
+    Args:
+        series (Series): 정규화할 문자열 시리즈.
+
+    Returns:
+        Series: 정규화된 문자열 시리즈.
+    """
+    # 공백 기준 split/join은 다중 공백 치환과 앞뒤 공백 제거를 한 번에 처리하며 정규식 치환보다 빠름
+    return (
+        series.str.lower()
+        .str.replace(re_special_chars, '', regex=True)
+        .str.split()
+        .str.join(' ')
+    )
+
+
+def combine_text(df, columns):
+    """
+    여러 컬럼의 텍스트를 공백으로 이어 붙인 시리즈를 반환하는 함수. 결측값은 빈 문자열로 처리함.
+
+    Args:
+        df (DataFrame): 결합할 컬럼을 포함한 데이터프레임.
+        columns (list): 결합할 컬럼 이름 리스트.
+
+    Returns:
+        Series: 결합된 문자열 시리즈.
+    """
+    text = df[columns].fillna('').astype(str)
+    return text[columns[0]].str.cat([text[column] for column in columns[1:]], sep=' ')
+
+
+def summarize_overview(overview):
+    """
+    GPT API를 사용하여 overview 요약을 생성하는 함수.
+
+    Args:
+        overview (str): 요약할 개요 텍스트.
+
+    Returns:
+        str: 요약된 텍스트. 요약할 수 없으면 None.
+    """
+    if pd.isna(overview) or not overview.strip():
+        return None
+    try:
+        with UPSTREAM_REQUEST_SECONDS.time(api='openai'):
+            response = openai.ChatCompletion.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "당신은 텍스트를 요약하는 유용한 어시스턴트입니다."},
+                    {"role": "user", "content": f"다음 텍스트를 한글로 요약해줘: {overview}"}
+                ]
+            )
+        if 'choices' in response:
+            UPSTREAM_REQUESTS_TOTAL.inc(api='openai', outcome='ok')
+            summary = response['choices'][0]['message']['content'].strip()
+            return summary
+        else:
+            UPSTREAM_REQUESTS_TOTAL.inc(api='openai', outcome='error')
+            logger.error("No choices found in the response.")
+            return None
+    except Exception as e:
+        UPSTREAM_REQUESTS_TOTAL.inc(api='openai', outcome='error')
+        logger.error(f"Error summarizing text: {e}")
+        return None
+
+
+def preprocess_data(df, classification_df=None, summarize=True):
     """
     데이터를 전처리하는 함수. 데이터를 가공하여 사용할 수 있게 만듦.
     
     Args:
         df (DataFrame): 원본 데이터가 포함된 데이터프레임.
+        classification_df (DataFrame, optional): 서비스 분류 테이블. 없으면 캐시된 분류 테이블을 사용함.
+        summarize (bool): GPT API로 overview 요약을 생성할지 여부.
     
     Returns:
         DataFrame: 전처리된 데이터를 포함한 데이터프레임.
@@ -201,50 +328,16 @@ def preprocess_data(df):
         df['sigungucode'] = df['sigungucode'].map(sigunguCode_mapping)
         df['contenttypeid'] = df['contenttypeid'].map(contenttypeid_mapping)
 
-        # 서비스 분류 엑셀 파일을 읽어와서 병합
-        classification_df = pd.read_excel('./한국관광공사_국문_서비스분류코드_v4.2.xlsx', header=4).iloc[:, 1:]
-        classification_df.columns = ['cat1', 'cat2', 'cat3', '대분류', '중분류', '소분류']
-
-        df = df.merge(classification_df, on=['cat1', 'cat2', 'cat3'], how='left')
-        df = df.drop(columns=['cat1', 'cat2', 'cat3'])
-        df = df.rename(columns={'대분류': 'cat1', '중분류': 'cat2', '소분류': 'cat3'})
+        # 서비스 분류 코드를 이름으로 변환
+        df[['cat1', 'cat2', 'cat3']] = lookup_classification(df, classification_df)
 
-        # 텍스트 결합
+        # 텍스트 결합 및 정규화
         columns_to_combine = ['addr1', 'cat1', 'cat2', 'cat3', 'contenttypeid', 'sigungucode', 'title', 'overview']
-        df['combined_text'] = df[columns_to_combine].fillna('').agg(' '.join, axis=1)
-
-        # 텍스트 정규화
-        def normalize_text(text):
-            text = text.lower()
-            text = re_special_chars.sub('', text)
-            text = re_multiple_spaces.sub(' ', text).strip()
-            return text
-
-        df['combined_text'] = df['combined_text'].apply(normalize_text)
+        df['combined_text'] = normalize_text(combine_text(df, columns_to_combine))
 
         # GPT API를 사용하여 overview 요약 생성
-        def summarize_overview(overview):
-            if pd.isna(overview) or not overview.strip():
-                return None
-            try:
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "당신은 텍스트를 요약하는 유용한 어시스턴트입니다."},
-                        {"role": "user", "content": f"다음 텍스트를 한글로 요약해줘: {overview}"}
-                    ]
-                )
-                if 'choices' in response:
-                    summary = response['choices'][0]['message']['content'].strip()
-                    return summary
-                else:
-                    logger.error("No choices found in the response.")
-                    return None
-            except Exception as e:
-                logger.error(f"Error summarizing text: {e}")
-                return None
-
-        df['overview_summary'] = df['overview'].apply(summarize_overview)
+        if summarize:
+            df['overview_summary'] = df['overview'].apply(summarize_overview)
 
         logger.info("Data preprocessing completed.")
         return df
@@ -254,45 +347,162 @@ def preprocess_data(df):
         return pd.DataFrame()
 
 
-def collect_data():
+def process_chunk(service_key, base_url, items, classification_df):
     """
-    데이터를 수집하고 전처리한 후, 데이터베이스에 저장하는 메인 함수.
+    수집된 항목 한 청크에 대해 overview 수집과 전처리를 수행하는 함수.
+
+    Args:
+        service_key (str): 공공데이터 API 서비스 키.
+        base_url (str): API의 기본 URL.
+        items (list): areaBasedList1 API에서 받은 항목 리스트.
+        classification_df (DataFrame): 서비스 분류 테이블.
+
+    Returns:
+        DataFrame: 전처리된 청크 데이터프레임.
     """
-    logger.info("Starting data collection and update process.")
+    df = pd.DataFrame(items)
 
+    # 추가 정보 수집
     try:
-        # 1. 데이터 수집
-        df = fetch_area_based_data(Config.SERVICE_KEY, Config.BASE_URL)
-        if df.empty:
-            logger.warning("No data to process. Exiting data collection.")
-            return
+        with COLLECTOR_STAGE_SECONDS.time(stage='detail'):
+            overviews = fetch_additional_overview(service_key, base_url, df)
+        if not overviews.empty:
+            df = pd.merge(df, overviews, on='contentid', how='left')
+            df['overview'] = df['overview'].fillna('정보 없음')
     except Exception as e:
-        logger.error(f"Error during data collection: {e}")
-        df = pd.DataFrame()
+        logger.error(f"Error fetching additional overviews: {e}")
 
-    # 2. 추가 정보 수집
-    if not df.empty:
-        try:
-            overviews = fetch_additional_overview(Config.SERVICE_KEY, Config.BASE_URL, df)
-            if not overviews.empty:
-                df = pd.merge(df, overviews, on='contentid', how='left')
-                df['overview'] = df['overview'].fillna('정보 없음')
-        except Exception as e:
-            logger.error(f"Error fetching additional overviews: {e}")
-
-    # 3. 데이터 전처리
+    # 데이터 전처리
     try:
-        df_processed = preprocess_data(df)
+        with COLLECTOR_STAGE_SECONDS.time(stage='preprocess'):
+            df_processed = preprocess_data(df, classification_df)
     except Exception as e:
         logger.error(f"Error processing data: {e}")
         df_processed = df
 
-    # 4. 데이터 저장
-    if not df_processed.empty:
+    return df_processed
+
+
+def collect_data():
+    """
+    데이터를 수집하고 전처리한 후, 데이터베이스에 저장하는 메인 함수.
+
+    목록 수집 → 상세조회/전처리 → 저장 단계를 크기가 제한된 큐로 연결하여,
+    청크 단위로 동시에 처리합니다. 메모리에는 큐에 대기 중인 청크만 유지되고,
+    처리된 청크는 곧바로 데이터베이스에 반영됩니다.
+
+    Returns:
+        dict: 저장된 행/청크 수, 단계별 소요 시간 합계, 외부 API 호출 횟수를 담은 실행 요약.
+    """
+    logger.info("Starting data collection and update process.")
+    stage_totals_before = COLLECTOR_STAGE_SECONDS.totals()
+    upstream_calls_before = UPSTREAM_REQUESTS_TOTAL.snapshot()
+
+    try:
+        classification_df = load_classification()
+    except Exception as e:
+        logger.error(f"Error loading classification table: {e}")
+        classification_df = None
+
+    workers = max(1, Config.COLLECT_WORKERS)
+    chunk_queue = queue.Queue(maxsize=Config.COLLECT_QUEUE_SIZE)
+    save_queue = queue.Queue(maxsize=Config.COLLECT_QUEUE_SIZE)
+
+    def produce():
+        # 1. 데이터 수집: 목록을 청크 단위로 큐에 넣음
         try:
-            save_to_db(df_processed)
-            logger.info("Processed data successfully saved to 'places' table.")
+            chunks = iter_area_based_items(Config.SERVICE_KEY, Config.BASE_URL)
+            while True:
+                with COLLECTOR_STAGE_SECONDS.time(stage='list'):
+                    items = next(chunks, None)
+                if items is None:
+                    break
+                chunk_queue.put(items)
+        except Exception as e:
+            logger.error(f"Error during data collection: {e}")
+        finally:
+            for _ in range(workers):
+                chunk_queue.put(None)
+
+    def process():
+        # 2~3. 추가 정보 수집 및 전처리
+        while True:
+            items = chunk_queue.get()
+            if items is None:
+                save_queue.put(None)
+                break
+            try:
+                df_processed = process_chunk(Config.SERVICE_KEY, Config.BASE_URL, items, classification_df)
+            except Exception as e:
+                logger.error(f"Error processing chunk: {e}")
+                df_processed = None
+            # 처리하지 못한 행을 실패로 집계할 수 있도록 입력 행 수와 함께 전달
+            save_queue.put((len(items), df_processed))
+
+    threads = [threading.Thread(target=produce, name='collector-producer', daemon=True)]
+    threads += [
+        threading.Thread(target=process, name=f'collector-worker-{i}', daemon=True)
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # 4. 데이터 저장: 처리된 청크를 도착하는 대로 저장
+    saved_chunks = 0
+    saved_rows = 0
+    failed_rows = 0
+    finished_workers = 0
+    while finished_workers < workers:
+        result = save_queue.get()
+        if result is None:
+            finished_workers += 1
+            continue
+        input_rows, df_processed = result
+        if df_processed is None or df_processed.empty:
+            logger.error(f"Dropped a chunk of {input_rows} rows that could not be processed.")
+            failed_rows += input_rows
+            continue
+        if len(df_processed) < input_rows:
+            logger.error(f"Lost {input_rows - len(df_processed)} of {input_rows} rows while processing a chunk.")
+            failed_rows += input_rows - len(df_processed)
+        try:
+            with COLLECTOR_STAGE_SECONDS.time(stage='save'):
+                saved = save_to_db(df_processed)
         except Exception as e:
             logger.error(f"Failed to save processed data to 'places' table: {e}")
+            saved = False
+        if not saved:
+            failed_rows += len(df_processed)
+            continue
+        saved_chunks += 1
+        saved_rows += len(df_processed)
+        logger.info(f"Saved chunk {saved_chunks} ({saved_rows} rows so far) to 'places' table.")
+
+    for thread in threads:
+        thread.join()
+
+    if failed_rows:
+        logger.error(f"Failed to process or save {failed_rows} collected rows to 'places' table.")
+    if saved_rows:
+        logger.info(f"Processed data successfully saved to 'places' table. ({saved_rows} rows)")
+    elif failed_rows:
+        # 저장된 행이 없는 실행은 성공으로 기록되지 않도록 실패로 처리
+        raise RuntimeError(f"Failed to process or save any of {failed_rows} collected rows to 'places' table.")
     else:
-        logger.warning("No processed data to save.")
\ No newline at end of file
+        raise RuntimeError("No data was collected, so nothing was saved to 'places' table.")
+
+    # 이번 실행 동안의 단계별 소요 시간과 외부 API 호출 횟수
+    stage_seconds = {}
+    for (stage,), (total, _) in COLLECTOR_STAGE_SECONDS.totals().items():
+        stage_seconds[stage] = round(total - stage_totals_before.get((stage,), (0.0, 0))[0], 3)
+    upstream_calls = {}
+    for (api, outcome), count in UPSTREAM_REQUESTS_TOTAL.snapshot().items():
+        upstream_calls[f'{api}:{outcome}'] = count - upstream_calls_before.get((api, outcome), 0)
+
+    return {
+        'rows': saved_rows,
+        'chunks': saved_chunks,
+        'failed_rows': failed_rows,
+        'stage_seconds': stage_seconds,
+        'upstream_calls': upstream_calls,
+    }
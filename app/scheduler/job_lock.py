@@ -0,0 +1,147 @@
+import errno
+import os
+import threading
+import mysql.connector
+from ..config.config import Config
+from ..db import get_db_connection
+from ..db.queries import GET_LOCK, RELEASE_LOCK, SET_SESSION_WAIT_TIMEOUT
+from ..logging import setup_logging
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 로그 설정
+logger = setup_logging(__name__)
+
+
+class MySQLJobLock:
+    """
+    MySQL GET_LOCK을 이용한 작업 잠금.
+    같은 데이터베이스를 사용하는 모든 워커와 호스트 사이에서 배타적으로 동작합니다.
+    잠금은 연결에 묶여 있으므로 잠금을 보유하는 동안 연결을 유지하며, 프로세스가 죽으면 자동으로 해제됩니다.
+    수집은 몇 시간씩 걸릴 수 있으므로 세션 wait_timeout을 늘리고, 보유하는 동안 연결을 주기적으로 ping하여
+    서버나 프록시의 유휴 시간 초과로 연결(과 잠금)이 끊기지 않게 합니다.
+    """
+
+    def __init__(self, name, timeout=0, keepalive_seconds=60, wait_timeout=86400):
+        self.name = name
+        self.timeout = timeout
+        self.keepalive_seconds = keepalive_seconds
+        self.wait_timeout = wait_timeout
+        self._conn = None
+        self._conn_lock = threading.Lock()
+        self._stop = None
+
+    def acquire(self):
+        """
+        잠금 획득을 시도하고 성공 여부를 반환하는 함수.
+        다른 곳에서 잠금을 보유 중이면 False를 반환하고, DB 오류로 확인하지 못하면 ConnectionError를 발생시킵니다.
+        """
+        conn = get_db_connection()
+        if conn is None:
+            raise ConnectionError("Failed to connect to the database for the job lock.")
+        try:
+            cursor = conn.cursor()
+            cursor.execute(SET_SESSION_WAIT_TIMEOUT, (self.wait_timeout,))
+            cursor.execute(GET_LOCK, (self.name, self.timeout))
+            (acquired,) = cursor.fetchone()
+            cursor.close()
+        except mysql.connector.Error as err:
+            conn.close()
+            raise ConnectionError(f"Failed to acquire job lock: {err}") from err
+        if acquired != 1:
+            conn.close()
+            return False
+        self._conn = conn
+        if self.keepalive_seconds > 0:
+            self._stop = threading.Event()
+            threading.Thread(
+                target=self._keepalive, args=(conn, self._stop), name='job-lock-keepalive', daemon=True
+            ).start()
+        return True
+
+    def _keepalive(self, conn, stop):
+        while not stop.wait(self.keepalive_seconds):
+            try:
+                with self._conn_lock:
+                    conn.ping(reconnect=False)
+            except mysql.connector.Error as err:
+                # 재연결하면 세션이 바뀌어 잠금이 이미 풀린 상태이므로 알리기만 함
+                logger.error(f"Job lock connection lost; lock '{self.name}' is no longer held: {err}")
+                return
+
+    def release(self):
+        """보유 중인 잠금을 해제하는 함수."""
+        if self._conn is None:
+            return
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+        try:
+            with self._conn_lock:
+                cursor = self._conn.cursor()
+                cursor.execute(RELEASE_LOCK, (self.name,))
+                cursor.fetchone()
+                cursor.close()
+        except mysql.connector.Error as err:
+            logger.warning(f"Failed to release job lock '{self.name}': {err}")
+        finally:
+            self._conn.close()
+            self._conn = None
+
+
+class FileJobLock:
+    """
+    로컬 파일 잠금을 이용한 작업 잠금.
+    같은 호스트의 모든 워커 프로세스 사이에서 배타적으로 동작하며, 프로세스가 죽으면 자동으로 해제됩니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def acquire(self):
+        """
+        잠금 획득을 시도하고 성공 여부를 반환하는 함수.
+        다른 프로세스가 잠금을 보유 중이면 False를 반환하고, 잠금 파일을 열 수 없는 등의 오류는 OSError로 발생시킵니다.
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError as e:
+            os.close(fd)
+            if e.errno in (errno.EACCES, errno.EAGAIN, errno.EDEADLK):
+                return False
+            raise
+        self._fd = fd
+        return True
+
+    def release(self):
+        """보유 중인 잠금을 해제하는 함수."""
+        if self._fd is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+def get_job_lock():
+    """설정(Config.COLLECTOR_LOCK)에 따라 수집 작업 잠금 객체를 생성하는 함수."""
+    if Config.COLLECTOR_LOCK == 'file':
+        return FileJobLock(Config.COLLECTOR_LOCK_PATH)
+    return MySQLJobLock(
+        Config.COLLECTOR_LOCK_NAME,
+        keepalive_seconds=Config.COLLECTOR_LOCK_KEEPALIVE_SECONDS,
+        wait_timeout=Config.COLLECTOR_LOCK_WAIT_TIMEOUT,
+    )
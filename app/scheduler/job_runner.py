@@ -0,0 +1,117 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from ..config.config import Config
+from ..logging import setup_logging
+from ..metrics import COLLECTOR_RUN_SECONDS, flush_metrics
+from .job_lock import get_job_lock
+
+# 로그 설정
+logger = setup_logging(__name__)
+
+
+def read_job_status():
+    """
+    마지막 수집 작업의 상태를 반환하는 함수.
+
+    Returns:
+        dict: status, started_at, finished_at, duration_seconds, error, summary 항목. 기록이 없으면 빈 dict.
+    """
+    try:
+        with open(Config.COLLECTOR_STATUS_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_job_status(status):
+    """수집 작업 상태를 상태 파일에 기록하는 함수. 임시 파일에 쓴 뒤 교체하여 부분 기록을 방지합니다."""
+    tmp_path = f"{Config.COLLECTOR_STATUS_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(status, f, ensure_ascii=False)
+        os.replace(tmp_path, Config.COLLECTOR_STATUS_PATH)
+    except OSError as e:
+        logger.warning(f"Failed to write collector status: {e}")
+
+
+def run_collect_job():
+    """
+    작업 잠금을 획득한 뒤 데이터 수집 작업을 실행하고, 상태와 소요 시간을 기록하는 함수.
+    다른 워커나 호스트가 이미 수집 중이면 실행하지 않고 건너뛰며, DB 오류 등으로 잠금을 확인하지 못하면 실패로 기록합니다.
+
+    Returns:
+        dict: 이번 실행의 상태 정보.
+    """
+    started = time.monotonic()
+    status = {
+        'status': 'running',
+        'pid': os.getpid(),
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'finished_at': None,
+        'duration_seconds': None,
+        'error': None,
+        'summary': None,
+    }
+
+    lock = get_job_lock()
+    try:
+        acquired = lock.acquire()
+    except OSError as e:
+        logger.error(f"Collector job could not check the job lock: {e}")
+        status['status'] = 'failed'
+        status['error'] = str(e)
+        return _finish_job(status, started)
+    if not acquired:
+        logger.info("Collector job is already running elsewhere. Skipping this run.")
+        return {'status': 'skipped'}
+
+    # 무거운 수집 모듈(pandas, openai, openpyxl)은 실제 수집 시에만 불러옴
+    from .data_collector import collect_data
+
+    write_job_status(status)
+    logger.info("Collector job started.")
+
+    try:
+        status['summary'] = collect_data()
+        status['status'] = 'success'
+    except Exception as e:
+        logger.error(f"Collector job failed: {e}")
+        status['status'] = 'failed'
+        status['error'] = str(e)
+    finally:
+        _finish_job(status, started)
+        lock.release()
+    return status
+
+
+def _finish_job(status, started):
+    status['finished_at'] = datetime.now().isoformat(timespec='seconds')
+    status['duration_seconds'] = round(time.monotonic() - started, 3)
+    COLLECTOR_RUN_SECONDS.observe(status['duration_seconds'], status=status['status'])
+    write_job_status(status)
+    # 별도 프로세스에서 실행된 경우 종료 전에 수집 지표를 합산 디렉터리에 기록
+    flush_metrics()
+
+    logger.info(f"Collector job finished with status '{status['status']}' in {status['duration_seconds']}s.")
+    return status
+
+
+def run_collect_job_in_process():
+    """
+    수집 작업을 별도 프로세스(python -m app.scheduler.worker --once)에서 실행하고 종료될 때까지 기다리는 함수.
+    수집 작업의 CPU 사용이 웹 프로세스의 GIL과 메모리를 점유하지 않도록 분리합니다.
+    multiprocessing의 spawn과 달리 웹 서버의 __main__(run.py)을 다시 불러오지 않으므로,
+    자식 프로세스에서 앱이나 스케줄러가 다시 만들어지지 않습니다.
+    """
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'app.scheduler.worker', '--once'],
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    )
+    logger.info(f"Collector process started (pid={process.pid}).")
+    exitcode = process.wait()
+    if exitcode != 0:
+        logger.error(f"Collector process exited with code {exitcode}.")
@@ -1,19 +1,26 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.schedulers.blocking import BlockingScheduler
 from datetime import datetime
-from .data_collector import collect_data
+from .job_runner import run_collect_job, run_collect_job_in_process
+from ..config.config import Config
 from ..logging import setup_logging
 
 # 로그 설정
-logger = setup_logging()
+logger = setup_logging(__name__)
 
 # 스케줄러 인스턴스 생성
 scheduler = BackgroundScheduler()
 is_scheduler_running_flag = False  # 스케줄러 실행 상태를 저장하는 변수
 
+# 수집 작업 실행 방식 선택
+# - inline: 웹 프로세스 안의 스레드에서 실행
+# - process: 웹 프로세스가 별도 프로세스를 띄워 실행
+# - external: 웹 프로세스에서는 실행하지 않음 (python -m app.scheduler.worker 사용)
+collect_job = run_collect_job if Config.COLLECTOR_MODE == 'inline' else run_collect_job_in_process
+
 # 스케줄러 작업 추가
 scheduler.add_job(
-    collect_data,
+    collect_job,
     'interval',
     weeks=1,
     id='collect_data_job',
@@ -24,6 +31,9 @@ scheduler.add_job(
 def start_scheduler():
     """스케줄러 시작 함수."""
     global is_scheduler_running_flag
+    if Config.COLLECTOR_MODE == 'external':
+        logger.info("Collector runs in an external worker. Scheduler is not started.")
+        return
     if not is_scheduler_running_flag:
         scheduler.start()
         is_scheduler_running_flag = True
@@ -0,0 +1,46 @@
+"""
+웹 프로세스와 분리된 수집 작업 워커.
+
+    python -m app.scheduler.worker          # 주기적으로 수집 (Config.JOBS와 같은 주기)
+    python -m app.scheduler.worker --once   # 한 번만 수집하고 종료
+"""
+import argparse
+import sys
+from datetime import datetime
+from apscheduler.schedulers.blocking import BlockingScheduler
+from ..logging import setup_logging
+from .job_runner import run_collect_job
+
+# 로그 설정
+logger = setup_logging(__name__)
+
+
+def main():
+    """수집 워커 메인 실행 함수."""
+    parser = argparse.ArgumentParser(description='gayou data collector worker')
+    parser.add_argument('--once', action='store_true', help='수집 작업을 한 번만 실행하고 종료')
+    args = parser.parse_args()
+
+    if args.once:
+        status = run_collect_job()
+        return 1 if status['status'] == 'failed' else 0
+
+    scheduler = BlockingScheduler()
+    scheduler.add_job(
+        run_collect_job,
+        'interval',
+        weeks=1,
+        id='collect_data_job',
+        max_instances=1,
+        next_run_time=datetime.now()
+    )
+    logger.info('Collector worker started.')
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        logger.info('Collector worker stopped.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+collect_data 처리량 벤치마크.
+
+로컬 TourAPI/요약 API 대역과 in-memory MySQL 대역을 사용하여 네트워크 없이 전체 수집
+파이프라인(목록 → 상세조회 → 전처리/요약 → 저장)을 실행하고, 처리량과 단계별 소요 시간을 측정합니다.
+
+    python -m benchmarks.bench_collector --rows 1000 --latency 0.005
+"""
+import argparse
+import time
+from .fake_mysql import FakeDatabase
+from .results import write_results
+from .stub_tourapi import StubChatCompletion, StubTourAPI
+from .synthetic import generate_raw_items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000])
+    parser.add_argument('--latency', type=float, default=0.0, help='대역 API의 요청당 지연 시간(초)')
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    from app.config.config import Config
+    from app.scheduler.data_collector import collect_data
+
+    results = []
+    for rows in args.rows:
+        db = FakeDatabase().install()
+        stub = StubTourAPI(generate_raw_items(rows), latency=args.latency).start()
+        StubChatCompletion.install(stub.base_url)
+        Config.BASE_URL = stub.base_url
+        try:
+            started = time.perf_counter()
+            summary = collect_data()
+            elapsed = time.perf_counter() - started
+        finally:
+            stub.stop()
+
+        results.append({
+            'rows': rows,
+            'latency_seconds': args.latency,
+            'chunk_size': Config.COLLECT_CHUNK_SIZE,
+            'workers': Config.COLLECT_WORKERS,
+            'seconds': round(elapsed, 3),
+            'rows_per_second': round(rows / elapsed, 2) if elapsed else None,
+            'saved_rows': len(db.places),
+            'stub_calls': dict(stub.calls),
+            'summary': summary,
+        })
+
+    write_results('collector', results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+preprocess_data 마이크로 벤치마크.
+
+기존 구현(매 실행 엑셀 파싱 + 행 단위 agg/apply)과 현재 구현(캐시된 분류 테이블 +
+벡터화된 문자열 연산)을 같은 합성 데이터에 대해 실행하고, 결과가 동일한지와 소요 시간을 비교합니다.
+
+    python -m benchmarks.bench_preprocess --rows 100000
+"""
+import argparse
+import re
+import time
+import pandas as pd
+from app.config.config import Config
+from app.scheduler import data_collector
+from .results import write_results
+from .synthetic import generate_raw_items
+
+
+def baseline_preprocess(df):
+    """변경 전 preprocess_data의 분류 병합과 텍스트 결합/정규화 경로(요약 제외)."""
+    classification_df = pd.read_excel(Config.CLASSIFICATION_XLSX_PATH, header=4).iloc[:, 1:]
+    classification_df.columns = ['cat1', 'cat2', 'cat3', '대분류', '중분류', '소분류']
+    df = df.merge(classification_df, on=['cat1', 'cat2', 'cat3'], how='left')
+    df = df.drop(columns=['cat1', 'cat2', 'cat3'])
+    df = df.rename(columns={'대분류': 'cat1', '중분류': 'cat2', '소분류': 'cat3'})
+
+    columns_to_combine = ['addr1', 'cat1', 'cat2', 'cat3', 'contenttypeid', 'sigungucode', 'title', 'overview']
+    df['combined_text'] = df[columns_to_combine].fillna('').agg(' '.join, axis=1)
+
+    re_special_chars = re.compile(r'[^a-z0-9가-힣\s]')
+    re_multiple_spaces = re.compile(r'\s+')
+
+    def normalize_text(text):
+        text = text.lower()
+        text = re_special_chars.sub('', text)
+        text = re_multiple_spaces.sub(' ', text).strip()
+        return text
+
+    df['combined_text'] = df['combined_text'].apply(normalize_text)
+    return df
+
+
+def map_codes(df):
+    """preprocess_data와 같은 코드 매핑을 적용하는 함수 (두 구현 모두 같은 입력을 받도록)."""
+    df = df.copy()
+    df['sigungucode'] = df['sigungucode'].map({1: '대덕구', 2: '동구', 3: '서구', 4: '유성구', 5: '중구'})
+    df['contenttypeid'] = df['contenttypeid'].map({
+        12: '관광지', 14: '문화시설', 15: '축제공연행사', 25: '여행코스',
+        28: '레포츠', 32: '숙박', 38: '쇼핑', 39: '음식점'
+    })
+    return df
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    df = pd.DataFrame(generate_raw_items(args.rows))
+
+    baseline, baseline_seconds = timed(baseline_preprocess, map_codes(df))
+    current, current_seconds = timed(data_collector.preprocess_data, df.copy(), summarize=False)
+
+    expected = baseline.set_index('contentid')['combined_text']
+    actual = current.set_index('contentid')['combined_text']
+    identical = bool(expected.sort_index().equals(actual.sort_index()))
+
+    write_results('preprocess', {
+        'rows': args.rows,
+        'baseline_seconds': round(baseline_seconds, 3),
+        'current_seconds': round(current_seconds, 3),
+        'speedup': round(baseline_seconds / current_seconds, 2) if current_seconds else None,
+        'combined_text_identical': identical,
+    }, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+/route/locations/, /route/locations/sort/, /route/locations/suggest/, /route/locations/facets/ 부하 벤치마크.
+
+합성 places 데이터를 in-memory MySQL 대역에 적재하고, 로컬 HTTP 서버로 띄운 애플리케이션에
+동시 요청을 보내 엔드포인트별 p50/p99 지연 시간과 처리량을 측정합니다.
+
+    python -m benchmarks.bench_routes --sizes 1000 10000 --requests 200 --concurrency 8
+"""
+import argparse
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from werkzeug.serving import make_server
+from .fake_mysql import FakeDatabase
+from .results import percentile, write_results
+from .synthetic import generate_places
+
+# 엔드포인트별 요청 시나리오 (순서대로 돌아가며 사용)
+SCENARIOS = {
+    'recommend': [
+        '/route/locations/?region=유성구&neighborhoods[]=봉명동&selectedConcepts[]=카페&selectedConcepts[]=공원&rec={i}',
+        '/route/locations/?region=중구&neighborhoods[]=전체&selectedConcepts[]=박물관&rec={i}',
+        '/route/locations/?region=서구&neighborhoods[]=둔산동&neighborhoods[]=탄방동&selectedConcepts[]=야경&rec={i}',
+    ],
+    'sort': [
+        '/route/locations/sort/?region=서구&selectedConcepts[]=야경&page={page}&page_size=10',
+        '/route/locations/sort/?region=유성구&neighborhoods[]=궁동&selectedConcepts[]=카페&page={page}&page_size=20',
+        '/route/locations/sort/?query=공원&selectedConcepts[]=산책로&page={page}&page_size=10',
+    ],
+    'suggest': [
+        '/route/locations/suggest/?q=봉',
+        '/route/locations/suggest/?q=ㄷㅈ',
+        '/route/locations/suggest/?q=유서',
+        '/route/locations/suggest/?q=한밭',
+    ],
+    'facets': [
+        '/route/locations/facets/',
+        '/route/locations/facets/?region=유성구&neighborhoods[]=봉명동&cat1[]=음식',
+        '/route/locations/facets/?region=서구&contenttypeid[]=관광지&contenttypeid[]=문화시설',
+    ],
+}
+
+
+def serve(app):
+    """애플리케이션을 로컬 스레드 HTTP 서버로 띄우고 (서버, 기본 URL)을 반환하는 함수."""
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, name='bench-server', daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def run_load(base_url, paths, total, concurrency):
+    """
+    paths를 순환하며 total개의 요청을 concurrency개의 동시 클라이언트로 보내고 결과를 집계하는 함수.
+
+    Returns:
+        dict: 요청 수, 오류 수, 지연 시간 백분위수(ms), 처리량(req/s), 평균 응답 크기(byte).
+    """
+    counter = itertools.count()
+    local = threading.local()
+
+    def one(_):
+        i = next(counter)
+        path = paths[i % len(paths)].format(i=i, page=1 + i % 5)
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = local.session = requests.Session()
+        start = time.perf_counter()
+        response = session.get(base_url + path)
+        elapsed = time.perf_counter() - start
+        return elapsed, response.status_code, len(response.content)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(one, range(total)))
+    wall = time.perf_counter() - started
+
+    latencies = [elapsed * 1000 for elapsed, _, _ in samples]
+    return {
+        'requests': total,
+        'errors': sum(1 for _, status, _ in samples if status >= 500),
+        'status_counts': {str(code): sum(1 for _, s, _ in samples if s == code) for code in sorted({s for _, s, _ in samples})},
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'max_ms': round(max(latencies), 2),
+        'throughput_rps': round(total / wall, 2),
+        'mean_response_bytes': int(sum(size for _, _, size in samples) / total),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--requests', type=int, default=200, help='엔드포인트별 요청 수')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--warmup', type=int, default=10, help='엔드포인트별 측정 전 요청 수')
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    db = FakeDatabase().install()
+
+    from app import create_app
+    app = create_app()
+    server, base_url = serve(app)
+
+    results = []
+    try:
+        for size in args.sizes:
+            db.places.clear()
+            db.load(generate_places(size))
+            for endpoint, paths in SCENARIOS.items():
+                run_load(base_url, paths, args.warmup, args.concurrency)
+                result = run_load(base_url, paths, args.requests, args.concurrency)
+                result.update({'endpoint': endpoint, 'rows': size, 'concurrency': args.concurrency})
+                results.append(result)
+    finally:
+        server.shutdown()
+
+    write_results('routes', results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+웹 워커 콜드 스타트 벤치마크.
+
+새 파이썬 프로세스에서 wsgi 모듈을 불러와(앱 생성 + 스냅샷 준비) 첫 요청을 처리하기까지의 시간을
+단계별로 측정하고, 수집기 전용 모듈(openai, openpyxl, apscheduler)이 웹 프로세스에 로드되었는지 확인합니다.
+
+    python -m benchmarks.bench_startup --rows 10000 --runs 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from .results import write_results
+from .synthetic import generate_places
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# 측정 대상 프로세스에서 실행할 코드
+CHILD = r'''
+import json, sys, time
+started = time.perf_counter()
+from benchmarks.fake_mysql import FakeDatabase
+with open(sys.argv[1], encoding='utf-8') as f:
+    FakeDatabase(json.load(f)).install()
+fixture_loaded = time.perf_counter()
+import wsgi
+ready = time.perf_counter()
+client = wsgi.app.test_client()
+response = client.get('/route/locations/sort/?region=유성구&selectedConcepts[]=카페')
+first_response = time.perf_counter()
+print(json.dumps({
+    'fixture_seconds': fixture_loaded - started,
+    'ready_seconds': ready - fixture_loaded,
+    'first_request_seconds': first_response - ready,
+    'cold_start_to_first_response_seconds': first_response - fixture_loaded,
+    'first_status': response.status_code,
+    'collector_modules_loaded': sorted(m for m in ('openai', 'openpyxl', 'apscheduler') if m in sys.modules),
+}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8', delete=False) as f:
+        json.dump(generate_places(args.rows), f, ensure_ascii=False, default=str)
+        fixture = f.name
+
+    runs = []
+    try:
+        for _ in range(args.runs):
+            output = subprocess.check_output(
+                [sys.executable, '-c', CHILD, fixture], cwd=PROJECT_ROOT, stderr=subprocess.DEVNULL,
+                env=dict(os.environ, LOG_LEVEL='WARNING'),
+            )
+            runs.append(json.loads(output.decode().strip().splitlines()[-1]))
+    finally:
+        os.remove(fixture)
+
+    cold_starts = sorted(run['cold_start_to_first_response_seconds'] for run in runs)
+    write_results('startup', {
+        'rows': args.rows,
+        'median_cold_start_seconds': round(cold_starts[len(cold_starts) // 2], 3),
+        'runs': runs,
+    }, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+벤치마크용 MySQL 대역(in-memory).
+
+app.db.queries에 정의된 쿼리만 해석하는 최소한의 구현으로, mysql.connector.connect를 대체하여
+네트워크와 MySQL 서버 없이 라우트와 수집기를 실행할 수 있게 합니다. 쿼리 해석 비용은 실제 서버의
+처리 시간과 다르므로, 결과는 애플리케이션 측 비용을 비교하는 용도로만 사용합니다.
+"""
+import re
+import threading
+from datetime import datetime
+import mysql.connector
+
+re_select = re.compile(r'^\s*SELECT\s+(?P<columns>.+?)\s+FROM\s+places\b(?P<rest>.*)$', re.S | re.I)
+re_insert = re.compile(r'^\s*INSERT\s+INTO\s+places\s*\((?P<columns>[^)]+)\)', re.S | re.I)
+re_limit = re.compile(r'\bLIMIT\s+(\d+)', re.I)
+re_where_in = re.compile(r'\b(?:WHERE|AND)\s+contentid\s+IN\s*\(', re.I)
+re_updated_since = re.compile(r'\blast_updated\s*>=\s*%s', re.I)
+re_lock = re.compile(r'^\s*SELECT\s+(GET_LOCK|RELEASE_LOCK)\s*\(', re.I)
+re_aggregate = re.compile(r'^(COUNT|MAX|SUM)\((\*|\w+|UNIX_TIMESTAMP\(\w+\))\)\s+AS\s+(\w+)$', re.I)
+re_unix_timestamp = re.compile(r'^UNIX_TIMESTAMP\((\w+)\)$', re.I)
+
+
+def _aggregate(rows, aggregates):
+    """COUNT(*) / MAX(column) / SUM(UNIX_TIMESTAMP(column)) 집계 결과 행을 계산하는 함수."""
+    result = {}
+    for match in aggregates:
+        func, column, alias = match.group(1).upper(), match.group(2), match.group(3)
+        if func == 'COUNT':
+            result[alias] = len(rows)
+            continue
+        unix_timestamp = re_unix_timestamp.match(column)
+        if unix_timestamp:
+            column = unix_timestamp.group(1)
+        values = [row.get(column) for row in rows if row.get(column) is not None]
+        if unix_timestamp:
+            # MySQL TIMESTAMP는 초 단위
+            values = [int(value.timestamp()) for value in values]
+        if func == 'SUM':
+            result[alias] = sum(values) if values else None
+        else:
+            result[alias] = max(values) if values else None
+    return result
+
+
+class FakeDatabase:
+    """contentid를 키로 places 행을 저장하는 in-memory 데이터베이스."""
+
+    def __init__(self, rows=()):
+        self.places = {}
+        self.locks = {}
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.load(rows)
+
+    def load(self, rows):
+        now = datetime.now()
+        with self.lock:
+            for row in rows:
+                row = dict(row)
+                row.setdefault('last_updated', now)
+                self.places[row['contentid']] = row
+
+    def connect(self, **kwargs):
+        """mysql.connector.connect와 같은 시그니처로 연결 객체를 반환하는 함수."""
+        with self.lock:
+            self.connections += 1
+        return FakeConnection(self)
+
+    def install(self):
+        """mysql.connector.connect를 이 데이터베이스로 대체하는 함수."""
+        mysql.connector.connect = self.connect
+        return self
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, dictionary=False):
+        return FakeCursor(self.db, self, dictionary)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        with self.db.lock:
+            for name, owner in list(self.db.locks.items()):
+                if owner is self:
+                    del self.db.locks[name]
+
+
+class FakeCursor:
+    def __init__(self, db, conn, dictionary):
+        self.db = db
+        self.conn = conn
+        self.dictionary = dictionary
+        self._rows = []
+        self.rowcount = 0
+
+    def _result(self, rows, columns):
+        if self.dictionary:
+            self._rows = [{column: row.get(column) for column in columns} for row in rows]
+        else:
+            self._rows = [tuple(row.get(column) for column in columns) for row in rows]
+        self.rowcount = len(self._rows)
+
+    def execute(self, query, params=None):
+        params = tuple(params or ())
+        text = query.strip()
+
+        if text.upper().startswith(('CREATE TABLE', 'SET SESSION')):
+            self._rows = []
+            return
+
+        lock = re_lock.match(text)
+        if lock:
+            name = params[0]
+            with self.db.lock:
+                if lock.group(1).upper() == 'GET_LOCK':
+                    owner = self.db.locks.get(name)
+                    acquired = 1 if owner in (None, self.conn) else 0
+                    if acquired:
+                        self.db.locks[name] = self.conn
+                    self._result([{'acquired': acquired}], ['acquired'])
+                else:
+                    released = 1 if self.db.locks.get(name) is self.conn else 0
+                    if released:
+                        del self.db.locks[name]
+                    self._result([{'released': released}], ['released'])
+            return
+
+        insert = re_insert.match(text)
+        if insert:
+            columns = [column.strip() for column in insert.group('columns').split(',')]
+            row = dict(zip(columns, params))
+            row['last_updated'] = datetime.now()
+            with self.db.lock:
+                self.db.places.setdefault(row['contentid'], {}).update(row)
+            self.rowcount = 1
+            return
+
+        if text.upper().startswith('DELETE FROM PLACES'):
+            with self.db.lock:
+                self.rowcount = 1 if self.db.places.pop(params[0], None) is not None else 0
+            return
+
+        select = re_select.match(text)
+        if select:
+            columns = [column.strip() for column in select.group('columns').split(',')]
+            with self.db.lock:
+                if re_where_in.search(select.group('rest')):
+                    rows = [self.db.places[key] for key in params if key in self.db.places]
+                elif re_updated_since.search(select.group('rest')):
+                    rows = [row for row in self.db.places.values() if row.get('last_updated') >= params[0]]
+                else:
+                    rows = list(self.db.places.values())
+            aggregates = [re_aggregate.match(column) for column in columns]
+            if all(aggregates):
+                self._result([_aggregate(rows, aggregates)], [match.group(3) for match in aggregates])
+                return
+            limit = re_limit.search(select.group('rest'))
+            if limit:
+                rows = rows[:int(limit.group(1))]
+            self._result(rows, columns)
+            return
+
+        raise NotImplementedError(f"FakeDatabase does not understand query: {text[:80]}")
+
+    def executemany(self, query, seq_params):
+        for params in seq_params:
+            self.execute(query, params)
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def close(self):
+        pass
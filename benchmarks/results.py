@@ -0,0 +1,58 @@
+"""벤치마크 결과를 비교 가능한 JSON 파일로 기록하는 도구."""
+import json
+import math
+import os
+import platform
+import subprocess
+from datetime import datetime
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+
+def percentile(values, q):
+    """정렬되지 않은 값 리스트의 q 백분위수(0~100)를 최근접 순위 방식으로 계산하는 함수."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(name, results, output=None):
+    """
+    벤치마크 결과를 실행 환경 정보와 함께 JSON 파일로 저장하는 함수.
+
+    Args:
+        name (str): 벤치마크 이름.
+        results (list | dict): 측정 결과.
+        output (str, optional): 저장 경로. 기본값은 benchmarks/results/<name>-<시각>.json.
+
+    Returns:
+        str: 저장된 파일 경로.
+    """
+    now = datetime.now()
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{name}-{now.strftime('%Y%m%d-%H%M%S')}.json")
+    payload = {
+        'benchmark': name,
+        'timestamp': now.isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': results,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(json.dumps(payload, ensure_ascii=False))
+    return output
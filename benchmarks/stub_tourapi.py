@@ -0,0 +1,145 @@
+"""
+벤치마크용 TourAPI / 요약 API 로컬 대역.
+
+areaBasedList1, detailCommon1, 요약(chat completions) 엔드포인트를 합성 데이터로 응답하는
+로컬 HTTP 서버로, 네트워크 없이 collect_data의 처리량을 측정할 수 있게 합니다.
+각 요청에 고정 지연(latency)을 넣어 실제 외부 API의 응답 시간을 흉내낼 수 있습니다.
+
+    python -m benchmarks.stub_tourapi --rows 1000 --port 8765
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import openai
+import requests
+from .synthetic import generate_raw_items
+
+
+class StubTourAPI:
+    """합성 데이터를 TourAPI 응답 형식으로 제공하는 로컬 HTTP 서버."""
+
+    def __init__(self, items, latency=0.0, host='127.0.0.1', port=0):
+        self.items = items
+        self.overviews = {item['contentid']: item['overview'] for item in items}
+        self.listing = [{k: v for k, v in item.items() if k != 'overview'} for item in items]
+        self.latency = latency
+        self.calls = {'areaBasedList1': 0, 'detailCommon1': 0, 'summarize': 0}
+        self._calls_lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, api):
+        with self._calls_lock:
+            self.calls[api] += 1
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, payload):
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                if url.path.endswith('/areaBasedList1'):
+                    stub._count('areaBasedList1')
+                    page_no = int(params.get('pageNo', 1))
+                    rows = int(params.get('numOfRows', 10))
+                    page = stub.listing[(page_no - 1) * rows:page_no * rows]
+                    self._send({'response': {'header': {'resultCode': '0000'}, 'body': {
+                        'items': {'item': page} if page else '',
+                        'numOfRows': rows, 'pageNo': page_no, 'totalCount': len(stub.listing),
+                    }}})
+                elif url.path.endswith('/detailCommon1'):
+                    stub._count('detailCommon1')
+                    content_id = int(params['contentId'])
+                    item = {'contentid': content_id, 'overview': stub.overviews.get(content_id, '')}
+                    self._send({'response': {'header': {'resultCode': '0000'}, 'body': {
+                        'items': {'item': [item]}, 'totalCount': 1,
+                    }}})
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if not self.path.endswith('/chat/completions'):
+                    self.send_error(404)
+                    return
+                stub._count('summarize')
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                text = payload.get('messages', [{}])[-1].get('content', '')
+                self._send({'choices': [{'message': {'role': 'assistant', 'content': text[-120:]}}]})
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name='stub-tourapi', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StubChatCompletion:
+    """
+    openai.ChatCompletion.create 호출을 로컬 대역 서버의 /v1/chat/completions로 보내는 대체 클래스.
+    summarize_overview의 호출 경로(지표 기록 포함)를 그대로 유지한 채 요약 API만 바꿉니다.
+    """
+
+    base_url = None
+    session = requests.Session()
+
+    @classmethod
+    def create(cls, model, messages):
+        response = cls.session.post(f"{cls.base_url}/v1/chat/completions", json={'model': model, 'messages': messages})
+        response.raise_for_status()
+        return response.json()
+
+    @classmethod
+    def install(cls, base_url):
+        cls.base_url = base_url
+        openai.ChatCompletion = cls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.0, help='요청당 지연 시간(초)')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    stub = StubTourAPI(generate_raw_items(args.rows), latency=args.latency, port=args.port).start()
+    print(f"Stub TourAPI listening on {stub.base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
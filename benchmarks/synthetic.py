@@ -0,0 +1,158 @@
+"""
+벤치마크용 합성 places 데이터 생성기.
+
+대전광역시의 실제 자치구/법정동 이름, 서비스 분류코드 표의 실제 분류, 로그정규 분포를 따르는
+overview 길이로 TourAPI 응답 형식(raw)과 places 테이블 형식(rows)의 데이터를 만듭니다.
+같은 seed에 대해서는 항상 같은 데이터를 생성합니다.
+
+    python -m benchmarks.synthetic --rows 10000 --output places_10k.json
+"""
+import argparse
+import json
+import math
+import random
+import pandas as pd
+from app.scheduler.classification import load_classification
+
+# 벤치마크 기본 데이터 크기
+SIZES = (1000, 10000, 100000)
+
+# TourAPI 대전 시군구 코드 -> (자치구, 법정동 목록)
+DISTRICTS = {
+    1: ('대덕구', ['오정동', '대화동', '회덕동', '비래동', '송촌동', '중리동', '법동', '신탄진동', '석봉동', '덕암동', '목상동']),
+    2: ('동구', ['가양동', '용전동', '판암동', '대동', '성남동', '홍도동', '삼성동', '신흥동', '효동', '가오동', '대청동', '산내동']),
+    3: ('서구', ['둔산동', '탄방동', '괴정동', '가장동', '내동', '변동', '도마동', '정림동', '용문동', '갈마동', '월평동', '만년동', '관저동', '가수원동']),
+    4: ('유성구', ['봉명동', '궁동', '어은동', '구암동', '노은동', '신성동', '전민동', '관평동', '원신흥동', '상대동', '지족동', '온천동']),
+    5: ('중구', ['은행동', '선화동', '대흥동', '문창동', '석교동', '부사동', '용두동', '오류동', '태평동', '유천동', '문화동', '산성동']),
+}
+
+ROADS = ['대학로', '계룡로', '한밭대로', '대덕대로', '중앙로', '유성대로', '둔산로', '동서대로', '대전로', '월드컵대로', '갑천로', '보문로']
+
+# 분류 대분류 코드별 비율 (음식점과 관광지가 대부분인 실제 데이터 분포를 근사)
+CATEGORY_WEIGHTS = {'A01': 0.15, 'A02': 0.2, 'A03': 0.08, 'A04': 0.07, 'A05': 0.3, 'B02': 0.12, 'C01': 0.08}
+
+# 분류 대분류 코드 -> (콘텐츠 타입 후보, 제목 접미어 후보)
+CATEGORY_PROFILES = {
+    'A01': ([12], ['공원', '수목원', '생태습지', '둘레길', '산림욕장', '계곡']),
+    'A02': ([12, 14, 15], ['박물관', '미술관', '전시관', '향교', '문화원', '축제', '기념관']),
+    'A03': ([28], ['캠핑장', '체육공원', '수영장', '자전거길', '클라이밍센터']),
+    'A04': ([38], ['시장', '지하상가', '아울렛', '공방거리']),
+    'A05': ([39], ['칼국수', '두부두루치기', '카페', '베이커리', '한정식', '국밥', '막국수']),
+    'B02': ([32], ['호텔', '게스트하우스', '한옥스테이', '리조트']),
+    'C01': ([25], ['당일코스', '야경코스', '가족코스']),
+}
+
+PHRASES = [
+    '대전을 대표하는 명소로 사계절 내내 방문객이 끊이지 않는다.',
+    '주변에 산책로와 쉼터가 잘 조성되어 있어 가족 단위 나들이에 좋다.',
+    '지역 주민들이 즐겨 찾는 곳으로 소박하지만 정겨운 분위기를 느낄 수 있다.',
+    '해 질 무렵의 풍경이 특히 아름다워 사진 촬영 명소로도 알려져 있다.',
+    '대중교통으로 접근하기 쉽고 주차 공간도 넉넉하다.',
+    '매년 다양한 체험 프로그램과 행사가 열린다.',
+    '오랜 역사를 지닌 곳으로 옛 모습이 잘 보존되어 있다.',
+    '계절마다 다른 꽃과 나무를 감상할 수 있다.',
+    'Wi-Fi와 편의시설(화장실, 수유실 등)을 갖추고 있다.',
+    '인근 맛집과 카페를 함께 둘러보는 코스로 인기가 많다!',
+]
+
+
+def _overview(rng):
+    """로그정규 분포(중앙값 약 300자)를 따르는 길이의 overview를 생성하는 함수."""
+    target = min(4000, max(40, int(rng.lognormvariate(math.log(300), 0.8))))
+    sentences = []
+    length = 0
+    while length < target:
+        sentence = rng.choice(PHRASES)
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return ' '.join(sentences)
+
+
+def generate_raw_items(n, seed=0):
+    """
+    areaBasedList1 + detailCommon1 응답을 합친 형식의 합성 항목 리스트를 생성하는 함수.
+
+    Args:
+        n (int): 생성할 항목 수.
+        seed (int): 난수 시드.
+
+    Returns:
+        list: TourAPI 항목 필드와 overview를 포함한 dict 리스트.
+    """
+    rng = random.Random(seed)
+    codes = {}
+    for cat1, cat2, cat3 in load_classification().index:
+        codes.setdefault(cat1, []).append((cat1, cat2, cat3))
+    groups = [cat1 for cat1 in CATEGORY_WEIGHTS if cat1 in codes]
+    weights = [CATEGORY_WEIGHTS[cat1] for cat1 in groups]
+    items = []
+    for i in range(n):
+        cat1, cat2, cat3 = rng.choice(codes[rng.choices(groups, weights)[0]])
+        content_types, suffixes = CATEGORY_PROFILES.get(cat1, ([12], ['명소']))
+        sigungucode = rng.randint(1, 5)
+        district, dongs = DISTRICTS[sigungucode]
+        dong = rng.choice(dongs)
+        items.append({
+            'contentid': 100000 + i,
+            'title': f"{dong.rstrip('동')} {rng.choice(suffixes)} {i}",
+            'addr1': f"대전광역시 {district} {rng.choice(ROADS)} {rng.randint(1, 400)}",
+            'addr2': f"({dong})" if rng.random() < 0.8 else '',
+            'cat1': cat1,
+            'cat2': cat2,
+            'cat3': cat3,
+            'contenttypeid': rng.choice(content_types),
+            'sigungucode': sigungucode,
+            'areacode': 3,
+            'cpyrhtDivCd': rng.choice(['Type1', 'Type3']),
+            'firstimage': f"http://tong.visitkorea.or.kr/cms/resource/{i % 100:02d}/{100000 + i}_image2_1.jpg",
+            'firstimage2': f"http://tong.visitkorea.or.kr/cms/resource/{i % 100:02d}/{100000 + i}_image3_1.jpg",
+            'mapx': round(rng.uniform(127.25, 127.55), 10),
+            'mapy': round(rng.uniform(36.20, 36.50), 10),
+            'mlevel': 6,
+            'tel': f"042-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            'zipcode': f"{rng.randint(34000, 35399)}",
+            'overview': _overview(rng),
+        })
+    return items
+
+
+def generate_places(n, seed=0):
+    """
+    places 테이블에 저장된 형식(전처리 완료)의 합성 행 리스트를 생성하는 함수.
+    수집기와 같은 preprocess_data를 거치므로 combined_text와 분류 이름이 실제 데이터와 같은 형태가 됩니다.
+
+    Args:
+        n (int): 생성할 행 수.
+        seed (int): 난수 시드.
+
+    Returns:
+        list: places 테이블 컬럼을 가진 dict 리스트.
+    """
+    from app.scheduler.data_collector import preprocess_data
+
+    df = preprocess_data(pd.DataFrame(generate_raw_items(n, seed)), summarize=False)
+    df['overview_summary'] = None
+    columns = [
+        'contentid', 'title', 'addr1', 'addr2', 'cat1', 'cat2', 'cat3', 'contenttypeid', 'sigungucode',
+        'overview', 'overview_summary', 'firstimage', 'firstimage2', 'cpyrhtDivCd', 'mapx', 'mapy',
+        'mlevel', 'tel', 'zipcode', 'combined_text',
+    ]
+    df = df[columns].astype(object).where(df[columns].notna(), None)
+    return df.to_dict(orient='records')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=SIZES[0])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--raw', action='store_true', help='TourAPI 응답 형식으로 생성')
+    parser.add_argument('--output', required=True)
+    args = parser.parse_args()
+
+    data = generate_raw_items(args.rows, args.seed) if args.raw else generate_places(args.rows, args.seed)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+"""gunicorn 설정 (gunicorn -c gunicorn.conf.py wsgi:app)."""
+import glob
+import multiprocessing
+import os
+import tempfile
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+keepalive = 5
+
+# 마스터에서 앱 생성과 스냅샷 준비를 한 번만 수행하고 워커는 fork로 공유
+preload_app = True
+
+# 오래 실행된 워커를 주기적으로 교체하여 메모리 단편화를 방지
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 1000))
+
+# 워커마다 따로 쌓이는 지표를 /metrics에서 합산하기 위한 디렉터리 (앱을 불러오기 전에 설정하고 이전 실행의 파일은 삭제)
+os.environ.setdefault('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'gayou-metrics'))
+for path in glob.glob(os.path.join(os.environ['METRICS_DIR'], '*.json*')):
+    os.remove(path)
+
+accesslog = None
+errorlog = '-'
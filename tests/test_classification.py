@@ -0,0 +1,40 @@
+import pickle
+
+import pandas as pd
+
+from app.config.config import Config
+from app.scheduler import classification
+from app.scheduler.classification import _read_xlsx, load_classification
+
+
+class BrokenPickle:
+    """다른 pandas 버전에서 기록된 DataFrame처럼 복원할 때 TypeError를 발생시키는 객체."""
+
+    def __reduce__(self):
+        return pd.StringDtype, ('unknown-storage', 'extra')
+
+
+def test_cache_round_trip_matches_the_xlsx(tmp_path, monkeypatch):
+    monkeypatch.setattr(classification, '_cached', None)
+    cache_path = str(tmp_path / 'classification.pkl')
+
+    written = load_classification(cache_path=cache_path)
+    monkeypatch.setattr(classification, '_cached', None)
+    read = load_classification(cache_path=cache_path)
+
+    expected = _read_xlsx(Config.CLASSIFICATION_XLSX_PATH)
+    pd.testing.assert_frame_equal(written, expected)
+    pd.testing.assert_frame_equal(read, expected)
+
+
+def test_unreadable_cache_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setattr(classification, '_cached', None)
+    cache_path = tmp_path / 'classification.pkl'
+    signature = classification._source_signature(Config.CLASSIFICATION_XLSX_PATH)
+    cache_path.write_bytes(pickle.dumps({'signature': signature, 'table': BrokenPickle()}))
+
+    table = load_classification(cache_path=str(cache_path))
+
+    assert len(table) > 0
+    with open(cache_path, 'rb') as f:
+        assert 'rows' in pickle.load(f)
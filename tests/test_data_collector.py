@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from app.scheduler import data_collector
+
+
+def run_collect(monkeypatch, chunks, process_chunk):
+    saved = []
+    monkeypatch.setattr(data_collector, 'load_classification', lambda: None)
+    monkeypatch.setattr(data_collector, 'iter_area_based_items', lambda *args: iter(chunks))
+    monkeypatch.setattr(data_collector, 'process_chunk', lambda key, url, items, table: process_chunk(items))
+    monkeypatch.setattr(data_collector, 'save_to_db', lambda df: saved.append(len(df)) or True)
+    return data_collector.collect_data(), saved
+
+
+def items(start, count):
+    return [{'contentid': i} for i in range(start, start + count)]
+
+
+def test_dropped_chunks_are_counted_as_failed(monkeypatch):
+    def process_chunk(chunk):
+        if chunk[0]['contentid'] == 100:
+            return pd.DataFrame()  # preprocess_data가 실패하면 빈 DataFrame을 반환
+        if chunk[0]['contentid'] == 200:
+            raise ValueError('broken chunk')
+        return pd.DataFrame(chunk)
+
+    summary, saved = run_collect(monkeypatch, [items(0, 100), items(100, 100), items(200, 50)], process_chunk)
+
+    assert saved == [100]
+    assert summary['rows'] == 100
+    assert summary['failed_rows'] == 150
+
+
+def test_run_that_saves_nothing_fails(monkeypatch):
+    with pytest.raises(RuntimeError):
+        run_collect(monkeypatch, [items(0, 20)], lambda chunk: pd.DataFrame())
+
+
+def test_run_without_collected_items_fails(monkeypatch):
+    with pytest.raises(RuntimeError):
+        run_collect(monkeypatch, [], lambda chunk: pd.DataFrame(chunk))
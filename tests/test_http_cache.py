@@ -0,0 +1,52 @@
+import json
+
+from flask import Flask, jsonify
+
+from app.config.config import Config
+from app.routes import http_cache
+from app.routes.http_cache import GZIP_ETAG_SUFFIX, conditional_get, init_compression
+
+
+class Snapshot:
+    version = 'v1'
+    loaded_at = 0
+
+
+def make_client(monkeypatch):
+    monkeypatch.setattr(http_cache, 'get_places_snapshot', Snapshot)
+    monkeypatch.setattr(Config, 'COMPRESS_MIN_SIZE', 100)
+    app = Flask(__name__)
+    init_compression(app)
+
+    @app.route('/places/')
+    @conditional_get
+    def places():
+        return jsonify({'data': ['장소'] * 100})
+
+    return app.test_client()
+
+
+def test_gzip_etag_round_trip(monkeypatch):
+    client = make_client(monkeypatch)
+
+    response = client.get('/places/', headers={'Accept-Encoding': 'gzip'})
+    etag = response.headers['ETag']
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert etag.endswith(GZIP_ETAG_SUFFIX + '"')
+
+    revalidated = client.get('/places/', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == etag
+
+
+def test_plain_etag_round_trip(monkeypatch):
+    client = make_client(monkeypatch)
+
+    response = client.get('/places/', headers={'Accept-Encoding': 'identity'})
+    etag = response.headers['ETag']
+    assert 'Content-Encoding' not in response.headers
+    assert len(json.loads(response.data)['data']) == 100
+
+    revalidated = client.get('/places/', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == etag
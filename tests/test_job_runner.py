@@ -0,0 +1,38 @@
+import json
+
+from app.config.config import Config
+from app.scheduler import job_runner
+from app.scheduler.job_lock import FileJobLock
+
+
+class BrokenLock:
+    def acquire(self):
+        raise ConnectionError("Failed to connect to the database for the job lock.")
+
+    def release(self):
+        raise AssertionError("release must not be called without the lock")
+
+
+def test_busy_lock_skips_the_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'COLLECTOR_STATUS_PATH', str(tmp_path / 'status.json'))
+    holder = FileJobLock(str(tmp_path / 'collector.lock'))
+    assert holder.acquire()
+    monkeypatch.setattr(job_runner, 'get_job_lock', lambda: FileJobLock(str(tmp_path / 'collector.lock')))
+
+    try:
+        assert job_runner.run_collect_job() == {'status': 'skipped'}
+    finally:
+        holder.release()
+    assert job_runner.read_job_status() == {}
+
+
+def test_lock_error_is_recorded_as_a_failed_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'COLLECTOR_STATUS_PATH', str(tmp_path / 'status.json'))
+    monkeypatch.setattr(job_runner, 'get_job_lock', BrokenLock)
+
+    status = job_runner.run_collect_job()
+
+    assert status['status'] == 'failed'
+    assert 'job lock' in status['error']
+    with open(tmp_path / 'status.json', encoding='utf-8') as f:
+        assert json.load(f)['status'] == 'failed'
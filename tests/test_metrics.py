@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+
+from app.metrics import metrics
+from app.metrics.metrics import Counter, Histogram, _MultiprocessStore
+
+
+def make_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, 'REGISTRY', [])
+    counter = Counter('test_requests_total', 'Test counter.', ['result'])
+    histogram = Histogram('test_seconds', 'Test histogram.', buckets=(1.0,))
+    return _MultiprocessStore(str(tmp_path), flush_seconds=60), counter, histogram
+
+
+def totals(store, counter, histogram):
+    dumps = store.collect()
+    return counter.merge(dumps.get(counter.name, [])), histogram.merge(dumps.get(histogram.name, []))
+
+
+def write(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+def test_reused_pid_keeps_the_previous_workers_totals(tmp_path, monkeypatch):
+    store, counter, histogram = make_store(tmp_path, monkeypatch)
+    write(store.path(), {counter.name: [[['hit'], 5]], histogram.name: [[[], [1, 0], 0.5, 1]]})
+
+    counter.inc(2, result='hit')
+    histogram.observe(2.0)
+    store.flush()
+    store.flush()
+
+    counts, histograms = totals(store, counter, histogram)
+    assert counts == {('hit',): 7}
+    assert histograms == {(): ([1, 1], 2.5, 2)}
+
+
+def test_compact_merges_dead_workers_into_one_file(tmp_path, monkeypatch):
+    store, counter, histogram = make_store(tmp_path, monkeypatch)
+    write(store.path(dead_pid()), {counter.name: [[['hit'], 3]]})
+    write(os.path.join(str(tmp_path), 'archived-1-1.json'), {counter.name: [[['miss'], 1]]})
+    write(os.path.join(str(tmp_path), 'compacted.json'), {counter.name: [[['hit'], 10]]})
+    counter.inc(1, result='hit')
+    store.flush()
+    before = totals(store, counter, histogram)
+
+    store.compact()
+
+    assert sorted(os.listdir(tmp_path)) == sorted(['.lock', 'compacted.json', f'{os.getpid()}.json'])
+    assert totals(store, counter, histogram) == before
+    assert before[0] == {('hit',): 14, ('miss',): 1}
@@ -0,0 +1,32 @@
+import pandas as pd
+
+from app.index.places_index import PlacesIndex, PlacesSnapshot
+
+
+def make_index(calls):
+    index = PlacesIndex(refresh_seconds=3600)
+    index._snapshot = PlacesSnapshot(pd.DataFrame([{'contentid': 1, 'title': '가야', 'combined_text': '카페'}]), 'v0')
+    # 마스터에서 넘겨받은 상태를 흉내 냄 (다른 pid에서 갱신 스레드를 시작한 적이 있음)
+    index._refresher_pid = -1
+    index.refresh_if_changed = lambda: calls.append(index._snapshot.version)
+    return index
+
+
+def test_forked_worker_checks_the_version_before_serving():
+    calls = []
+    index = make_index(calls)
+
+    index.get()
+    index.get()
+
+    assert calls == ['v0']
+
+
+def test_inherited_snapshot_is_not_compacted_for_its_age():
+    index = make_index([])
+    index._snapshot.deltas = 1
+    index._snapshot.fitted_at -= 2 * index.compact_seconds
+
+    index.is_ready()
+
+    assert not index.needs_compaction(index._snapshot)
@@ -0,0 +1,111 @@
+from datetime import datetime
+
+import pandas as pd
+
+from app.index.places_index import PlacesSnapshot
+
+T0 = datetime(2024, 1, 1)
+T1 = datetime(2024, 1, 2)
+T2 = datetime(2024, 1, 3)
+
+
+def place(content_id, title, last_updated=T0, sigungucode='1', addr2='(봉명동)', text='카페 디저트'):
+    return {
+        'contentid': content_id, 'title': title, 'addr1': '대전광역시 유성구', 'addr2': addr2,
+        'cat1': '음식', 'cat2': '음식점', 'contenttypeid': '음식점', 'sigungucode': sigungucode,
+        'firstimage': None, 'combined_text': text, 'last_updated': last_updated,
+    }
+
+
+def make_snapshot(*rows):
+    return PlacesSnapshot(pd.DataFrame(list(rows)), 'v0')
+
+
+def live(snapshot):
+    return snapshot.df.set_index('contentid').sort_index()
+
+
+def suggested_ids(snapshot, query):
+    return [item.get('contentid') for item in snapshot.suggest_index.suggest(query, 100) if item['type'] == 'place']
+
+
+def test_upsert_and_delete_replace_only_changed_rows():
+    base = make_snapshot(place(1, '가야'), place(2, '나무'), place(3, '다리'))
+
+    snapshot = base.apply_changes(pd.DataFrame([place(2, '나비', T1), place(4, '라면', T1)]), {3}, 'v1')
+
+    assert live(snapshot)['title'].to_dict() == {1: '가야', 2: '나비', 4: '라면'}
+    assert snapshot.size == 3 and snapshot.dead_rows == 2
+    assert suggested_ids(snapshot, '나') == [2]
+    assert suggested_ids(snapshot, '다') == []
+    assert snapshot.facet_index.counts()['total'] == 3
+    # 이전 스냅샷은 그대로
+    assert live(base)['title'].to_dict() == {1: '가야', 2: '나무', 3: '다리'}
+    assert suggested_ids(base, '다') == [3]
+    assert base.facet_index.counts()['total'] == 3
+
+
+def test_reupsert_of_tombstoned_id():
+    snapshot = make_snapshot(place(1, '가야'), place(2, '나무'))
+
+    snapshot = snapshot.apply_changes(pd.DataFrame(), {2}, 'v1')
+    snapshot = snapshot.apply_changes(pd.DataFrame([place(2, '나무', T1)]), set(), 'v2')
+    snapshot = snapshot.apply_changes(pd.DataFrame([place(2, '나비', T2)]), set(), 'v3')
+
+    assert live(snapshot)['title'].to_dict() == {1: '가야', 2: '나비'}
+    assert suggested_ids(snapshot, '나') == [2]
+    assert snapshot.facet_index.counts()['total'] == 2
+    assert snapshot.lineage.rows[2][0] == snapshot.total_rows - 1
+
+
+def test_delete_and_insert_in_the_same_poll_keeps_the_row():
+    snapshot = make_snapshot(place(1, '가야'), place(2, '나무'))
+
+    snapshot = snapshot.apply_changes(pd.DataFrame([place(2, '나비', T1)]), {2}, 'v1')
+
+    assert live(snapshot)['title'].to_dict() == {1: '가야', 2: '나비'}
+    assert snapshot.size == 2
+
+
+def test_deleting_the_newest_row_keeps_the_watermark():
+    snapshot = make_snapshot(place(1, '가야', T0), place(2, '나무', T1))
+
+    snapshot = snapshot.apply_changes(pd.DataFrame(), {2}, 'v1')
+
+    assert snapshot.watermark == T1
+    assert list(live(snapshot).index) == [1]
+
+
+def test_empty_changed_frame_without_columns():
+    base = make_snapshot(place(1, '가야'), place(2, '나무'))
+
+    snapshot = base.apply_changes(pd.DataFrame(), set(), 'v1')
+
+    assert snapshot.version == 'v1'
+    assert snapshot.size == 2 and snapshot.total_rows == 2
+    assert live(snapshot)['title'].to_dict() == {1: '가야', 2: '나무'}
+    assert snapshot.watermark == base.watermark
+
+
+def test_drop_unchanged_skips_rows_already_applied():
+    snapshot = make_snapshot(place(1, '가야', T0), place(2, '나무', T1))
+
+    changed = snapshot.drop_unchanged(pd.DataFrame([place(1, '가야', T0), place(2, '나비', T2)]))
+
+    assert changed['contentid'].tolist() == [2]
+
+
+def test_similarity_and_facets_follow_the_segments():
+    snapshot = make_snapshot(place(1, '가야', text='카페'), place(2, '나무', text='박물관'))
+
+    snapshot = snapshot.apply_changes(
+        pd.DataFrame([place(3, '다리', T1, sigungucode='2', addr2='(궁동)', text='카페 디저트')]), {1}, 'v1'
+    )
+
+    rows = snapshot.select(lambda df: df)
+    similarity = dict(zip(rows['contentid'], snapshot.similarity(rows.index.to_numpy(), '카페')))
+    assert similarity[3] > 0 and similarity[2] == 0
+    counts = snapshot.facet_index.counts(neighborhoods=['봉명동'])
+    assert counts['total'] == 1
+    sigungu = {item['value']: item['count'] for item in snapshot.facet_index.counts()['facets']['sigungucode']}
+    assert sigungu == {'1': 1, '2': 1}
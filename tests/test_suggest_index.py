@@ -0,0 +1,42 @@
+from app.index.suggest_index import PrefixKeys, SuggestIndex, jongseong_split, last_char_range, to_chosung
+
+NAMES = ['봉명동', '봉산동', '보문산', '유성구', '유성온천', '서구', '석교동', '달걀빵', '닭갈비집', '대전역', '동구']
+
+
+def suggest_texts(query, limit=20):
+    index = SuggestIndex([(name, 'place', 1.0, i) for i, name in enumerate(NAMES)])
+    return sorted(item['text'] for item in index.suggest(query, limit))
+
+
+def test_last_char_range():
+    assert last_char_range('ㅁ') == ('마', '밓')
+    assert last_char_range('서') == ('서', '섷')
+    assert last_char_range('석') == ('석', '석')
+    assert last_char_range('a') == ('a', 'a')
+
+
+def test_jongseong_split():
+    assert jongseong_split('석') == ('서', 'ㄱ')
+    assert jongseong_split('닭') == ('달', 'ㄱ')
+    assert jongseong_split('서') is None
+    assert jongseong_split('a') is None
+
+
+def test_lone_initial_consonant():
+    assert suggest_texts('봉ㅁ') == ['봉명동']
+
+
+def test_syllable_without_its_final_consonant():
+    assert suggest_texts('유서') == ['유성구', '유성온천']
+
+
+def test_final_consonant_moves_to_the_next_syllable():
+    assert suggest_texts('석') == ['서구', '석교동']
+    assert suggest_texts('닭') == ['달걀빵', '닭갈비집']
+
+
+def test_all_initial_consonant_query():
+    assert to_chosung('대전역') == 'ㄷㅈㅇ'
+    assert suggest_texts('ㄷㅈ') == ['대전역']
+    keys = PrefixKeys((name, i) for i, name in enumerate(NAMES))
+    assert sorted(NAMES[i] for i in keys.candidates('ㅂㅁ')) == ['보문산', '봉명동']
@@ -0,0 +1,19 @@
+"""
+프로덕션 WSGI 진입점.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+gunicorn.conf.py는 preload_app을 사용하므로 마스터 프로세스가 애플리케이션을 만들고 places 스냅샷과
+색인을 준비한 뒤 워커를 fork합니다. 워커는 준비된 메모리를 copy-on-write로 공유하고, 첫 요청 전에 데이터셋 버전만 확인하여
+마스터가 부팅 후 놓친 변경분을 반영합니다.
+"""
+from app import create_app
+from app.index import warm_up
+from app.logging import setup_logging
+
+logger = setup_logging(__name__)
+
+app = create_app()
+
+if not warm_up():
+    logger.warning('Places index is not ready yet. /health/ready will report 503 until it loads.')